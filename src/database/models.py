@@ -4,10 +4,15 @@ Ensures all job data conforms to expected schema.
 """
 
 import hashlib
+import re
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List, Any
-from pydantic import BaseModel, Field, field_validator, computed_field
+from typing import Optional, List, Any, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, computed_field
+
+# Compiled once - clean_description runs for every RawJob built by the sources
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
 
 
 class JobStatus(str, Enum):
@@ -100,13 +105,11 @@ class RawJob(BaseModel):
     @field_validator('description', mode='before')
     @classmethod
     def clean_description(cls, v: Any) -> str:
-        if v is None:
-            return ""
+        if not v:
+            return ""  # Many sources pass "" - skip the regex passes
         # Remove HTML tags
-        import re
-        text = str(v)
-        text = re.sub(r'<[^>]+>', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = _HTML_TAG_RE.sub(' ', str(v))
+        text = _WHITESPACE_RE.sub(' ', text)
         return text.strip()[:5000]
     
     @field_validator('url', mode='before')
@@ -116,12 +119,18 @@ class RawJob(BaseModel):
             return ""
         return str(v).strip()
     
+    # (id text, hash) - reused while title/company/source are unchanged
+    _job_id_cache: Optional[Tuple[str, str]] = PrivateAttr(default=None)
+    
     @computed_field
     @property
     def job_id(self) -> str:
-        """Generate unique ID from title + company + source"""
+        """Generate unique ID from title + company + source (re-hashed only when they change)"""
         text = f"{self.title}_{self.company}_{self.source}".lower()
-        return hashlib.md5(text.encode()).hexdigest()[:16]
+        cached = self._job_id_cache
+        if cached is None or cached[0] != text:
+            cached = self._job_id_cache = (text, hashlib.md5(text.encode()).hexdigest()[:16])
+        return cached[1]
 
 
 class ProcessedJob(BaseModel):
@@ -4,6 +4,7 @@ Handles persistence, deduplication, and state tracking.
 """
 
 import sqlite3
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional, Set
@@ -107,6 +108,19 @@ class JobDatabase:
                     last_call_at TIMESTAMP,
                     UNIQUE(api_name, month)
                 );
+                
+                -- Short-lived cache of raw API responses
+                CREATE TABLE IF NOT EXISTS response_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    expires_at REAL NOT NULL
+                );
+                
+                -- Counters that must survive between runs (e.g. rotation cursors)
+                CREATE TABLE IF NOT EXISTS source_state (
+                    state_key TEXT PRIMARY KEY,
+                    counter INTEGER NOT NULL DEFAULT 0
+                );
             """)
     
     def get_known_job_ids(self) -> Set[str]:
@@ -298,17 +312,17 @@ class JobDatabase:
             row = cursor.fetchone()
             return row['call_count'] if row else 0
     
-    def increment_api_usage(self, api_name: str) -> int:
-        """Increment API usage and return new count"""
+    def increment_api_usage(self, api_name: str, count: int = 1) -> int:
+        """Increment API usage by count and return new count"""
         month = datetime.now().strftime('%Y-%m')
         with self._get_connection() as conn:
             conn.execute("""
                 INSERT INTO api_usage (api_name, month, call_count, last_call_at)
-                VALUES (?, ?, 1, CURRENT_TIMESTAMP)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
                 ON CONFLICT(api_name, month) DO UPDATE SET
-                    call_count = call_count + 1,
+                    call_count = call_count + excluded.call_count,
                     last_call_at = CURRENT_TIMESTAMP
-            """, (api_name, month))
+            """, (api_name, month, count))
             
             cursor = conn.execute(
                 "SELECT call_count FROM api_usage WHERE api_name = ? AND month = ?",
@@ -316,6 +330,41 @@ class JobDatabase:
             )
             return cursor.fetchone()['call_count']
     
+    # Persistent counters
+    def next_counter(self, state_key: str) -> int:
+        """Return a persistent counter's current value (0 on first use) and advance it by one"""
+        with self._get_connection() as conn:
+            conn.execute("""
+                INSERT INTO source_state (state_key, counter) VALUES (?, 1)
+                ON CONFLICT(state_key) DO UPDATE SET counter = counter + 1
+            """, (state_key,))
+            
+            cursor = conn.execute(
+                "SELECT counter FROM source_state WHERE state_key = ?", (state_key,)
+            )
+            return cursor.fetchone()['counter'] - 1
+    
+    # Response cache
+    def get_cached_response(self, cache_key: str) -> Optional[bytes]:
+        """Get a cached response body, or None if missing/expired"""
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT body FROM response_cache WHERE cache_key = ? AND expires_at > ?",
+                (cache_key, time.time())
+            )
+            row = cursor.fetchone()
+            return row['body'] if row else None
+    
+    def set_cached_response(self, cache_key: str, body: bytes, ttl: int):
+        """Cache a response body for ttl seconds"""
+        now = time.time()
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM response_cache WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "INSERT OR REPLACE INTO response_cache (cache_key, body, expires_at) VALUES (?, ?, ?)",
+                (cache_key, body, now + ttl)
+            )
+    
     def cleanup_old_jobs(self, days: int = 30):
         """Remove jobs older than specified days"""
         cutoff = datetime.now() - timedelta(days=days)
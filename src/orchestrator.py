@@ -6,7 +6,7 @@ Coordinates all components: sources, matching, filtering, notifications.
 import asyncio
 import sys
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set
 import logging
 
 from .config.settings import settings
@@ -20,7 +20,8 @@ from .sources.base import (
 from .sources.india import (
     NaukriSource, FounditSource, InstahyreSource,
     CutshortSource, HiristSource, LinkedInIndiaSource,
-    GoogleJobsSource, GoogleJobsDirectSource, AdzunaIndiaSource, IndeedIndiaPlaywrightSource
+    GoogleJobsSource, GoogleJobsDirectSource, AdzunaIndiaSource, IndeedIndiaPlaywrightSource,
+    close_browser
 )
 from .sources.free_apis import (
     GreenhouseMultiSource, LeverMultiSource, WorkingNomadsSource,
@@ -30,6 +31,12 @@ from .sources.free_apis import (
 from .matching.semantic import get_matcher
 from .filters.llm_filter import get_llm_filter, get_quick_filter
 from .utils.notifications import get_telegram_notifier, get_console_notifier
+from .utils.http import close_shared_client
+
+try:
+    import uvloop  # libuv-based event loop, faster for many small I/O coroutines
+except ImportError:
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(
@@ -157,11 +164,12 @@ class JobWatchdog:
             all_kw.extend(keywords)
         return list(set(all_kw))
     
-    async def _fetch_from_source(self, source: BaseJobSource, keywords: List[str]) -> JobBatch:
+    async def _fetch_from_source(self, source: BaseJobSource, keywords: List[str],
+                                 seen_urls: Set[str]) -> JobBatch:
         """Fetch jobs from a single source with error handling"""
         try:
             logger.debug(f"Fetching from {source.name}...")
-            batch = await source.fetch_jobs(keywords)
+            batch = await source.fetch_jobs(keywords, seen_urls)
             
             if batch.error:
                 logger.warning(f"{source.name}: {batch.error}")
@@ -185,9 +193,12 @@ class JobWatchdog:
         logger.info(f"Fetching from {len(self.sources)} sources...")
         logger.info(f"Keywords: {', '.join(keywords[:5])}...")
         
+        # Listing URLs already returned by any source this scan
+        seen_urls: Set[str] = set()
+        
         # Create tasks for concurrent fetching
         tasks = [
-            self._fetch_from_source(source, keywords)
+            self._fetch_from_source(source, keywords, seen_urls)
             for source in self.sources
         ]
         
@@ -350,11 +361,12 @@ class JobWatchdog:
         # Telegram notifications
         if self.telegram.is_configured:
             logger.info(f"Sending {len(jobs_to_notify)} Telegram notifications...")
-            sent = await self.telegram.send_jobs_batch(jobs_to_notify)
+            sent_jobs = await self.telegram.send_jobs_batch(jobs_to_notify)
+            sent = len(sent_jobs)
             self.stats.total_notified = sent
             
-            # Update job status in memory AND database
-            for job in jobs_to_notify[:sent]:
+            # Update job status in memory AND database (only jobs actually delivered)
+            for job in sent_jobs:
                 job.status = JobStatus.NOTIFIED
                 job.notified_at = datetime.now()
                 # Persist to database
@@ -477,12 +489,20 @@ class JobWatchdog:
 async def main():
     """Main entry point"""
     watchdog = JobWatchdog()
-    await watchdog.run()
+    try:
+        await watchdog.run()
+    finally:
+        await watchdog.telegram.aclose()
+        await close_browser()
+        await close_shared_client()
 
 
 def run():
-    """Synchronous entry point"""
-    asyncio.run(main())
+    """Synchronous entry point (uses uvloop when installed)"""
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
 
 
 if __name__ == "__main__":
@@ -4,19 +4,100 @@ All sources inherit from this and implement fetch_jobs().
 """
 
 import asyncio
+import re
 import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Callable, Iterable, List, Optional, Pattern, Set
 from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import httpx
 import logging
 
 from ..database.models import RawJob, JobBatch
 from ..config.settings import settings
+from ..utils.http import get_shared_client
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json if orjson isn't installed
+    orjson = None
+    import json
+
+try:
+    import ahocorasick
+except ImportError:  # Fall back to a regex alternation
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
 
+def json_loads(content: bytes):
+    """Decode a JSON response body (orjson when available, ~3-5x faster)"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def json_dumps(obj) -> bytes:
+    """Encode a value as JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def keyword_pattern(keywords: Iterable[str]) -> Pattern:
+    """
+    Compile keywords into a single regex alternation.
+    pattern.search(text) scans once in C instead of one `in` check per keyword.
+    Keywords are matched as-is, so pass them already lowercased.
+    """
+    alternatives = '|'.join(re.escape(k) for k in keywords if k)
+    return re.compile(alternatives or r'(?!)')  # (?!) never matches
+
+
+# Query parameters that only track where a click came from (utm_* is handled by prefix)
+_TRACKING_PARAMS = frozenset({
+    'ref', 'refid', 'referrer', 'src', 'source', 'gh_src', 'trk', 'trackingid',
+    'lever-source', 'lever-origin', 'fbclid', 'gclid',
+})
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalize a job URL for cross-source dedup.
+    Drops tracking parameters, the fragment and any trailing slash, and lowercases
+    the scheme and host. The path and the remaining query (often the job ID,
+    e.g. ?jk= or ?gh_jid=) are kept as-is.
+    """
+    parts = urlsplit(url)
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith('utm_') and k.lower() not in _TRACKING_PARAMS
+    )
+    return urlunsplit((
+        parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), urlencode(query), ''
+    ))
+
+
+def build_keyword_matcher(keywords: Iterable[str]) -> Callable[[str], bool]:
+    """
+    Build a predicate telling whether text contains any of the keywords.
+    Uses an Aho-Corasick automaton (one linear scan for all keywords) when
+    pyahocorasick is installed, otherwise keyword_pattern().
+    Keywords are matched as-is, so pass them already lowercased.
+    """
+    words = [k for k in keywords if k]
+    if ahocorasick is None or not words:
+        pattern = keyword_pattern(words)
+        return lambda text: pattern.search(text) is not None
+    
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+
 class BaseJobSource(ABC):
     """Abstract base class for all job sources"""
     
@@ -26,18 +107,11 @@ class BaseJobSource(ABC):
     timeout: int = 30
     
     def __init__(self):
-        self.client: Optional[httpx.AsyncClient] = None
         self.last_request_time: float = 0
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
-        if self.client is None or self.client.is_closed:
-            self.client = httpx.AsyncClient(
-                timeout=self.timeout,
-                headers=self._default_headers(),
-                follow_redirects=True
-            )
-        return self.client
+        """Get the process-wide pooled client (headers and timeout are sent per request)"""
+        return get_shared_client()
     
     def _default_headers(self) -> dict:
         """Default headers for requests"""
@@ -60,10 +134,15 @@ class BaseJobSource(ABC):
         client = await self._get_client()
         
         try:
+            request_options = {
+                "headers": self._default_headers(),
+                "timeout": self.timeout,
+                "follow_redirects": True,
+            }
             if method == "GET":
-                response = await client.get(url, params=params)
+                response = await client.get(url, params=params, **request_options)
             else:
-                response = await client.post(url, data=params)
+                response = await client.post(url, data=params, **request_options)
             
             response.raise_for_status()
             return response
@@ -78,19 +157,35 @@ class BaseJobSource(ABC):
             return None
     
     async def close(self):
-        """Close HTTP client"""
-        if self.client and not self.client.is_closed:
-            await self.client.aclose()
+        """Release per-source resources (the shared client is closed at shutdown)"""
     
     @abstractmethod
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         """
         Fetch jobs matching keywords.
         Must be implemented by each source.
+        seen_urls is shared across sources in a scan; see _claim_url().
         Returns a JobBatch with jobs and metadata.
         """
         pass
     
+    @staticmethod
+    def _claim_url(url: str, seen_urls: Optional[Set[str]]) -> bool:
+        """
+        Record url in the scan-wide seen set.
+        Returns False if another source already returned the same listing.
+        Bare site URLs (no path or query, e.g. a listing with no job link) are never claimed.
+        """
+        if seen_urls is None or not url:
+            return True
+        canonical = canonical_url(url)
+        if not any(c in canonical.split('://', 1)[-1] for c in '/?'):
+            return True
+        if canonical in seen_urls:
+            return False
+        seen_urls.add(canonical)
+        return True
+    
     def _matches_keywords(self, text: str, keywords: List[str]) -> bool:
         """Check if text contains any of the keywords"""
         text_lower = text.lower()
@@ -163,7 +258,7 @@ class RemoteOKSource(BaseJobSource):
     name = "RemoteOK"
     base_url = "https://remoteok.com/api"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -173,7 +268,7 @@ class RemoteOKSource(BaseJobSource):
             if not response:
                 return JobBatch(source=self.name, error="Request failed")
             
-            data = response.json()
+            data = json_loads(response.content)
             job_list = data[1:] if len(data) > 1 else []  # First item is metadata
             
             for job in job_list:
@@ -211,7 +306,7 @@ class ArbeitnowSource(BaseJobSource):
     name = "Arbeitnow"
     base_url = "https://www.arbeitnow.com/api/job-board-api"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -258,7 +353,7 @@ class HimalayasSource(BaseJobSource):
     name = "Himalayas"
     base_url = "https://himalayas.app/jobs/api"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -313,7 +408,7 @@ class JobicySource(BaseJobSource):
     name = "Jobicy"
     base_url = "https://jobicy.com/api/v2/remote-jobs"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -376,7 +471,7 @@ class FindworkSource(BaseJobSource):
     name = "Findwork"
     base_url = "https://findwork.dev/api/jobs/"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -426,7 +521,7 @@ class TheMuseSource(BaseJobSource):
     name = "TheMuse"
     base_url = "https://www.themuse.com/api/public/jobs"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -483,7 +578,7 @@ class HNHiringSource(BaseJobSource):
     name = "HN-Hiring"
     base_url = "https://hn.algolia.com/api/v1"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
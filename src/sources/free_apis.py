@@ -4,18 +4,29 @@ These sources significantly increase job coverage at no cost.
 """
 
 import asyncio
+import heapq
+import itertools
 import time
 import re
-from typing import List, Optional, Set
-from datetime import datetime
+from typing import Dict, List, Optional, Set
 import logging
 
+import httpx
+
 from ..database.models import RawJob, JobBatch
 from ..config.settings import settings
-from .base import BaseJobSource
+from ..utils.http import request_with_retry
+from .base import BaseJobSource, json_dumps, json_loads, keyword_pattern
 
 logger = logging.getLogger(__name__)
 
+# Job boards change at most a few times per hour; boards are kept in the SQLite
+# response cache so back-to-back runs within the TTL skip the request
+BOARD_CACHE_TTL_SECONDS = 1200
+
+
+_ASHBY_LOCATION_RE = re.compile(r'india|bangalore|remote|anywhere|global')
+
 
 class GreenhouseMultiSource(BaseJobSource):
     """
@@ -66,7 +77,7 @@ class GreenhouseMultiSource(BaseJobSource):
         "shopify", "bigcommerce", "commercetools", "salsify", "akeneo",
     ]
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -78,8 +89,10 @@ class GreenhouseMultiSource(BaseJobSource):
             
             async with httpx.AsyncClient(timeout=15) as client:
                 # Rotate through companies - check 15 companies per run
-                hour = datetime.now().hour
-                minute = datetime.now().minute // 15  # 0-3
+                # Hour and quarter-hour from the epoch clock (no datetime allocation)
+                now_minutes = int(time.time() // 60)
+                hour = now_minutes // 60
+                minute = (now_minutes % 60) // 15  # 0-3
                 start_idx = ((hour % 4) * 4 + minute) * 15
                 companies_to_check = self.COMPANIES[start_idx:start_idx+15]
                 
@@ -179,7 +192,7 @@ class LeverMultiSource(BaseJobSource):
         "lightning-ai", "determined-ai", "grid-ai", "mosaicml", "together",
     ]
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -191,7 +204,7 @@ class LeverMultiSource(BaseJobSource):
             
             async with httpx.AsyncClient(timeout=15) as client:
                 # Check 12 companies per run
-                hour = datetime.now().hour
+                hour = int(time.time() // 3600)
                 start_idx = (hour % 4) * 12
                 companies_to_check = self.COMPANIES[start_idx:start_idx+12]
                 
@@ -270,7 +283,7 @@ class WorkingNomadsSource(BaseJobSource):
     name = "WorkingNomads"
     base_url = "https://www.workingnomads.com/api/exposed_jobs/"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -330,7 +343,7 @@ class RemotiveSource(BaseJobSource):
     name = "Remotive"
     base_url = "https://remotive.com/api/remote-jobs"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -407,7 +420,7 @@ class WeWorkRemotelySource(BaseJobSource):
         "https://weworkremotely.com/remote-jobs.rss",
     ]
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -494,7 +507,7 @@ class JustRemoteSource(BaseJobSource):
     name = "JustRemote"
     base_url = "https://justremote.co/api/jobs"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -549,7 +562,7 @@ class YCJobsSource(BaseJobSource):
     """
     name = "YC-Jobs"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -625,7 +638,7 @@ class StartupJobsSource(BaseJobSource):
     """
     name = "StartupJobs"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -685,6 +698,7 @@ class AshbyMultiSource(BaseJobSource):
     """
     name = "Ashby"
     rate_limit_seconds = 0.3
+    graphql_url = "https://jobs.ashbyhq.com/api/non-user-graphql"
     
     COMPANIES = [
         "ramp", "notion", "linear", "replit", "vercel",
@@ -694,19 +708,93 @@ class AshbyMultiSource(BaseJobSource):
         "figma", "loom", "pitch", "miro", "coda",
     ]
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    # Ashby's board query has no server-side title filter, so request only the
+    # job fields we actually read (team id/name are never used)
+    BOARD_FIELDS = "teams { jobs { id title employmentType locationName } }"
+    
+    async def _fetch_board(self, client, company: str) -> Optional[list]:
+        """Fetch a single company's board (fallback when batching is rejected)"""
+        payload = {
+            "operationName": "ApiJobBoardWithTeams",
+            "variables": {"organizationHostedJobsPageName": company},
+            "query": f"""query ApiJobBoardWithTeams($organizationHostedJobsPageName: String!) {{
+                jobBoard: jobBoardWithTeams(organizationHostedJobsPageName: $organizationHostedJobsPageName) {{
+                    {self.BOARD_FIELDS}
+                }}
+            }}"""
+        }
+        response = await request_with_retry(
+            client, "POST", f"{self.graphql_url}?op=ApiJobBoardWithTeams", json=payload
+        )
+        
+        # The happy path always has this shape; a null/missing board means no jobs page
+        try:
+            return json_loads(response.content)['data']['jobBoard']['teams']
+        except (KeyError, TypeError):
+            return None
+    
+    async def _fetch_boards(self, client, companies: List[str]) -> Dict[str, list]:
+        """
+        Fetch several boards in one round-trip using one aliased field per company.
+        Falls back to one query per company if the batched query is rejected or fails.
+        """
+        boards: Dict[str, list] = {}
+        
+        var_defs = ", ".join(f"$org{i}: String!" for i in range(len(companies)))
+        fields = "\n".join(
+            f"c{i}: jobBoardWithTeams(organizationHostedJobsPageName: $org{i}) {{ {self.BOARD_FIELDS} }}"
+            for i in range(len(companies))
+        )
+        payload = {
+            "operationName": "ApiJobBoardsWithTeams",
+            "variables": {f"org{i}": company for i, company in enumerate(companies)},
+            "query": f"query ApiJobBoardsWithTeams({var_defs}) {{\n{fields}\n}}",
+        }
+        
+        data = None
+        try:
+            response = await request_with_retry(
+                client, "POST", f"{self.graphql_url}?op=ApiJobBoardsWithTeams", json=payload
+            )
+            data = json_loads(response.content)['data']
+        except (httpx.HTTPError, KeyError, TypeError) as e:
+            # Rejected or still failing after retries - each company then fails on its own
+            logger.debug(f"{self.name}: Batched query failed ({str(e)[:100]})")
+        
+        if data:
+            for i, company in enumerate(companies):
+                try:
+                    boards[company] = data[f"c{i}"]['teams']
+                except (KeyError, TypeError):
+                    continue  # Unknown board - aliased field comes back null
+            return boards
+        
+        # Fetch one by one
+        for company in companies:
+            try:
+                teams = await self._fetch_board(client, company)
+                if teams is not None:
+                    boards[company] = teams
+                await asyncio.sleep(0.2)
+            except Exception as e:
+                logger.debug(f"{self.name}: Error {company}: {e}")
+        return boards
+    
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
+        from ..database.repository import db
+        
         start = time.time()
         jobs = []
         error = None
-        keywords_lower = [k.lower() for k in keywords]
+        keyword_re = keyword_pattern(k.lower() for k in keywords)
         seen_ids: Set[str] = set()
         
         try:
             import httpx
             
             async with httpx.AsyncClient(timeout=15, follow_redirects=True) as client:
-                hour = datetime.now().hour
-                start_idx = (hour % 5) * 5
+                # Round-robin over the company list; the cursor is stored in the DB so each run moves on
+                start_idx = (db.next_counter("ashby:window") * 5) % len(self.COMPANIES)
                 companies_to_check = self.COMPANIES[start_idx:start_idx+5]
                 
                 if not companies_to_check:
@@ -714,45 +802,44 @@ class AshbyMultiSource(BaseJobSource):
                 
                 logger.info(f"{self.name}: Checking {len(companies_to_check)} companies")
                 
+                # Serve fresh boards from cache, fetch the rest in a single request
+                boards: Dict[str, list] = {}
+                to_fetch = []
                 for company in companies_to_check:
+                    cached = db.get_cached_response(f"ashby:{company}:board")
+                    if cached is None:
+                        to_fetch.append(company)
+                    else:
+                        boards[company] = json_loads(cached)
+                
+                if to_fetch:
+                    fetched = await self._fetch_boards(client, to_fetch)
+                    for company, teams in fetched.items():
+                        db.set_cached_response(f"ashby:{company}:board", json_dumps(teams), BOARD_CACHE_TTL_SECONDS)
+                    boards.update(fetched)
+                
+                for company, teams in boards.items():
+                    display_name = company.replace('-', ' ').title()
                     try:
-                        url = f"https://jobs.ashbyhq.com/api/non-user-graphql?op=ApiJobBoardWithTeams"
-                        payload = {
-                            "operationName": "ApiJobBoardWithTeams",
-                            "variables": {"organizationHostedJobsPageName": company},
-                            "query": """query ApiJobBoardWithTeams($organizationHostedJobsPageName: String!) {
-                                jobBoard: jobBoardWithTeams(organizationHostedJobsPageName: $organizationHostedJobsPageName) {
-                                    teams { id name jobs { id title employmentType locationName } }
-                                }
-                            }"""
-                        }
-                        response = await client.post(url, json=payload)
-                        
-                        if response.status_code != 200:
-                            continue
-                        
-                        data = response.json()
-                        teams = data.get('data', {}).get('jobBoard', {}).get('teams', [])
-                        
                         for team in teams:
                             for job in team.get('jobs', []):
-                                title = job.get('title', '').lower()
-                                location = job.get('locationName', 'Remote')
+                                raw_title = job.get('title') or ''
                                 
-                                is_relevant = any(kw in title for kw in keywords_lower)
+                                # Cheap keyword check first - most jobs stop here
+                                if keyword_re.search(raw_title.lower()) is None:
+                                    continue
                                 
-                                location_lower = location.lower()
-                                is_india_remote = any(loc in location_lower for loc in [
-                                    'india', 'bangalore', 'remote', 'anywhere', 'global'
-                                ])
+                                location = job.get('locationName', 'Remote')
+                                if _ASHBY_LOCATION_RE.search(location.lower()) is None:
+                                    continue
                                 
-                                job_key = f"{job.get('title', '')}_{company}"
+                                job_key = f"{raw_title}_{company}"
                                 
-                                if is_relevant and is_india_remote and job_key not in seen_ids:
+                                if job_key not in seen_ids:
                                     seen_ids.add(job_key)
                                     jobs.append(RawJob(
-                                        title=job.get('title', 'Unknown'),
-                                        company=company.replace('-', ' ').title(),
+                                        title=raw_title,
+                                        company=display_name,
                                         location=location,
                                         description="",
                                         url=f"https://jobs.ashbyhq.com/{company}/{job.get('id', '')}",
@@ -761,8 +848,6 @@ class AshbyMultiSource(BaseJobSource):
                                         job_type=job.get('employmentType', ''),
                                     ))
                         
-                        await asyncio.sleep(0.2)
-                        
                     except Exception as e:
                         logger.debug(f"{self.name}: Error {company}: {e}")
                         continue
@@ -779,12 +864,13 @@ class AshbyMultiSource(BaseJobSource):
 class EuropeRemoteSource(BaseJobSource):
     """European remote job boards - JustJoin.it"""
     name = "Europe-Remote"
+    max_jobs = 25  # Newest matches kept per scan
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
-        keywords_lower = [k.lower() for k in keywords]
+        keyword_re = keyword_pattern(k.lower() for k in keywords)
         
         try:
             import httpx
@@ -795,29 +881,29 @@ class EuropeRemoteSource(BaseJobSource):
                     response = await client.get(url)
                     
                     if response.status_code == 200:
-                        data = response.json()
+                        data = json_loads(response.content)
                         
-                        for job in data[:100]:
-                            title = job.get('title', '').lower()
-                            workplace = job.get('workplace_type', '')
-                            
-                            is_relevant = any(kw in title for kw in keywords_lower)
-                            is_remote = workplace.lower() == 'remote'
+                        matches = (
+                            job for job in itertools.islice(data, 100)
+                            if keyword_re.search(job.get('title', '').lower()) is not None
+                            and job.get('workplace_type', '').lower() == 'remote'
+                        )
+                        
+                        # Bounded heap: only the newest max_jobs matches become RawJobs
+                        for job in heapq.nlargest(self.max_jobs, matches, key=lambda j: j.get('published_at') or ''):
+                            salary = job.get('employment_types', [{}])[0]
+                            salary_str = f"{salary.get('from', '')}-{salary.get('to', '')} {salary.get('currency', '')}"
                             
-                            if is_relevant and is_remote:
-                                salary = job.get('employment_types', [{}])[0]
-                                salary_str = f"{salary.get('from', '')}-{salary.get('to', '')} {salary.get('currency', '')}"
-                                
-                                jobs.append(RawJob(
-                                    title=job.get('title', 'Unknown'),
-                                    company=job.get('company_name', 'Unknown'),
-                                    location="Remote (Europe)",
-                                    description="",
-                                    url=f"https://justjoin.it/offers/{job.get('id', '')}",
-                                    source=self.name,
-                                    posted=job.get('published_at', ''),
-                                    salary=salary_str if salary.get('from') else None,
-                                ))
+                            jobs.append(RawJob(
+                                title=job.get('title', 'Unknown'),
+                                company=job.get('company_name', 'Unknown'),
+                                location="Remote (Europe)",
+                                description="",
+                                url=f"https://justjoin.it/offers/{job.get('id', '')}",
+                                source=self.name,
+                                posted=job.get('published_at', ''),
+                                salary=salary_str if salary.get('from') else None,
+                            ))
                 except Exception as e:
                     logger.debug(f"{self.name}: JustJoin.it error: {e}")
             
@@ -833,12 +919,13 @@ class EuropeRemoteSource(BaseJobSource):
 class CryptoJobsSource(BaseJobSource):
     """Crypto/Web3 job boards - remote-first companies"""
     name = "Crypto-Jobs"
+    max_jobs = 25  # Newest matches kept per scan
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
-        keywords_lower = [k.lower() for k in keywords] + ['data', 'analyst', 'python', 'ml', 'ai']
+        keyword_re = keyword_pattern([k.lower() for k in keywords] + ['data', 'analyst', 'python', 'ml', 'ai'])
         
         try:
             import httpx
@@ -849,23 +936,24 @@ class CryptoJobsSource(BaseJobSource):
                     response = await client.get(url)
                     
                     if response.status_code == 200:
-                        data = response.json()
+                        data = json_loads(response.content)
+                        job_list = data.get('jobs', []) if isinstance(data, dict) else data
                         
-                        for job in data.get('jobs', data if isinstance(data, list) else [])[:50]:
-                            title = job.get('title', '').lower()
-                            
-                            is_relevant = any(kw in title for kw in keywords_lower)
-                            
-                            if is_relevant:
-                                jobs.append(RawJob(
-                                    title=job.get('title', 'Unknown'),
-                                    company=job.get('company', 'Unknown'),
-                                    location="Remote (Web3)",
-                                    description=job.get('description', '')[:2000],
-                                    url=job.get('url', job.get('apply_url', '')),
-                                    source=self.name,
-                                    posted=job.get('created_at', ''),
-                                ))
+                        matches = (
+                            job for job in itertools.islice(job_list, 50)
+                            if keyword_re.search(job.get('title', '').lower()) is not None
+                        )
+                        
+                        for job in heapq.nlargest(self.max_jobs, matches, key=lambda j: j.get('created_at') or ''):
+                            jobs.append(RawJob(
+                                title=job.get('title', 'Unknown'),
+                                company=job.get('company', 'Unknown'),
+                                location="Remote (Web3)",
+                                description=job.get('description', '')[:2000],
+                                url=job.get('url', job.get('apply_url', '')),
+                                source=self.name,
+                                posted=job.get('created_at', ''),
+                            ))
                 except Exception as e:
                     logger.debug(f"{self.name}: Web3.career error: {e}")
             
@@ -888,11 +976,13 @@ class IndiaStartupsSource(BaseJobSource):
         "browserstack", "postman", "chargebee", "druva", "icertis",
     ]
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
+        from ..database.repository import db
+        
         start = time.time()
         jobs = []
         error = None
-        keywords_lower = [k.lower() for k in keywords]
+        keyword_re = keyword_pattern(k.lower() for k in keywords)
         
         try:
             import httpx
@@ -900,24 +990,31 @@ class IndiaStartupsSource(BaseJobSource):
             async with httpx.AsyncClient(timeout=15, follow_redirects=True) as client:
                 for company in self.GREENHOUSE_INDIA[:8]:
                     try:
-                        url = f"https://boards-api.greenhouse.io/v1/boards/{company}/jobs"
-                        response = await client.get(url)
+                        # Same key as GreenhouseMultiSource in india.py, so the two share boards
+                        cache_key = f"greenhouse:{company}:jobs"
+                        body = db.get_cached_response(cache_key)
                         
-                        if response.status_code != 200:
-                            continue
+                        if body is None:
+                            url = f"https://boards-api.greenhouse.io/v1/boards/{company}/jobs"
+                            # Transient 5xx/network errors are retried; 4xx raise and skip the company
+                            response = await request_with_retry(client, "GET", url)
+                            body = response.content
+                            db.set_cached_response(cache_key, body, BOARD_CACHE_TTL_SECONDS)
+                            await asyncio.sleep(0.3)
                         
-                        data = response.json()
+                        company_jobs = json_loads(body).get('jobs', [])
                         
-                        for job in data.get('jobs', []):
-                            title = job.get('title', '').lower()
-                            location = job.get('location', {}).get('name', '') if isinstance(job.get('location'), dict) else ''
-                            
-                            is_relevant = any(kw in title for kw in keywords_lower)
+                        display_name = company.title()
+                        
+                        for job in company_jobs:
+                            raw_title = job.get('title') or ''
                             
-                            if is_relevant:
+                            if keyword_re.search(raw_title.lower()) is not None:
+                                location = job.get('location')
+                                location = location.get('name', '') if isinstance(location, dict) else ''
                                 jobs.append(RawJob(
-                                    title=job.get('title', 'Unknown'),
-                                    company=company.title(),
+                                    title=raw_title,
+                                    company=display_name,
                                     location=location or 'India',
                                     description="",
                                     url=job.get('absolute_url', ''),
@@ -925,8 +1022,6 @@ class IndiaStartupsSource(BaseJobSource):
                                     posted=job.get('updated_at', ''),
                                 ))
                         
-                        await asyncio.sleep(0.3)
-                        
                     except Exception as e:
                         logger.debug(f"{self.name}: Error {company}: {e}")
                         continue
@@ -4,18 +4,143 @@ Optimized for Pune, Mumbai, Bangalore, Hyderabad, Delhi NCR regions.
 """
 
 import asyncio
+import os
 import time
 import re
-from typing import List, Optional
-from datetime import datetime
+from typing import List, NamedTuple, Optional, Set, Union
+from datetime import datetime, timedelta
 import logging
 
 from ..database.models import RawJob, JobBatch
 from ..config.settings import settings
-from .base import BaseJobSource
+from ..utils.http import get_shared_client, request_with_retry, ACCEPT_ENCODING
+from .base import BaseJobSource, json_loads, build_keyword_matcher
+
+try:
+    import ijson  # Incremental JSON parsing for large feeds
+except ImportError:
+    ijson = None
+
+try:
+    import msgspec  # Typed JSON decoding into slot-based structs
+except ImportError:
+    msgspec = None
 
 logger = logging.getLogger(__name__)
 
+BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Per-source request headers (sent per request on the shared client)
+NAUKRI_HEADERS = {
+    "User-Agent": BROWSER_USER_AGENT,
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Accept": "application/json",
+    "Referer": "https://www.naukri.com/",
+    "appid": "109",
+    "systemid": "109",
+}
+FOUNDIT_HEADERS = {
+    "User-Agent": BROWSER_USER_AGENT,
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Accept": "application/json",
+    "Referer": "https://www.foundit.in/",
+}
+INSTAHYRE_HEADERS = {
+    "User-Agent": BROWSER_USER_AGENT,
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Accept": "application/json",
+    "Referer": "https://www.instahyre.com/",
+}
+HIRIST_HEADERS = {
+    "User-Agent": BROWSER_USER_AGENT,
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Accept": "application/json",
+}
+LINKEDIN_HEADERS = {
+    "User-Agent": BROWSER_USER_AGENT,
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Accept": "text/html,application/xhtml+xml",
+}
+# Plain JSON APIs (SerpAPI, Greenhouse, WorkingNomads) only need compression
+JSON_API_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+# LinkedIn guest search page: job link or screen-reader title, whichever comes next
+_LI_CARD_RE = re.compile(
+    r'href="(https://www\.linkedin\.com/jobs/view/[^"]+)"'
+    r'|<span class="sr-only">([^<]+)</span>'
+)
+
+# Listing URL prefixes (the APIs only return the path or slug)
+_NAUKRI_PREFIX = "https://www.naukri.com"
+_INSTAHYRE_JOB_PREFIX = "https://www.instahyre.com/job/"
+_CUTSHORT_JOB_PREFIX = "https://cutshort.io/job/"
+
+# India or remote-friendly location tokens (fixed, so the matcher is built once)
+_INDIA_REMOTE_TOKENS = (
+    'india', 'bangalore', 'bengaluru', 'mumbai', 'pune',
+    'hyderabad', 'delhi', 'gurgaon', 'noida', 'chennai',
+    'remote', 'anywhere', 'worldwide', 'global',
+)
+_INDIA_REMOTE_MATCHER = build_keyword_matcher(_INDIA_REMOTE_TOKENS)
+
+
+def _format_error(e: Exception) -> str:
+    """Short error text for JobBatch.error (skips __str__, which can embed whole response bodies)"""
+    return f"{type(e).__name__}: {e.args[0] if e.args else ''}"[:200]
+
+
+async def _request(client, method: str, url: str, **kwargs):
+    """Send a request, retrying 5xx/network errors up to 3 times with jittered 0.5-4s backoff"""
+    return await request_with_retry(
+        client, method, url, backoff=0.5, max_backoff=4.0, jitter=0.5, **kwargs
+    )
+
+
+async def _cached_get(client, key: str, url: str, ttl: int = 900, **kwargs):
+    """
+    GET a JSON endpoint through the SQLite response cache.
+    Keys follow {source}:{identifier}:{resource}; raises httpx.HTTPStatusError on non-2xx.
+    """
+    from ..database.repository import db
+    
+    cached = db.get_cached_response(key)
+    if cached is not None:
+        return json_loads(cached)
+    
+    response = await _request(client, "GET", url, **kwargs)
+    db.set_cached_response(key, response.content, ttl)
+    return json_loads(response.content)
+
+
+class _AsyncByteReader:
+    """Adapt an async byte iterator to the async file-like object ijson reads from"""
+    
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = b""
+        self._exhausted = False
+    
+    async def _fill(self, size: int):
+        """Pull chunks until the buffer holds `size` bytes (or everything, if size < 0)"""
+        while not self._exhausted and (size < 0 or len(self._buffer) < size):
+            try:
+                self._buffer += await self._chunks.__anext__()
+            except StopAsyncIteration:
+                self._exhausted = True
+    
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str; that must not consume data
+        if size == 0:
+            return b""
+        await self._fill(size)
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
 
 class NaukriSource(BaseJobSource):
     """
@@ -26,94 +151,80 @@ class NaukriSource(BaseJobSource):
     base_url = "https://www.naukri.com/jobapi/v3/search"
     rate_limit_seconds = 2.0
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
         seen_ids = set()
+        semaphore = asyncio.Semaphore(2)  # Caps in-flight requests instead of sleeping between them
         
-        try:
-            # Custom headers to mimic browser
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "application/json",
-                "Referer": "https://www.naukri.com/",
-                "appid": "109",
-                "systemid": "109",
+        async def fetch_one(client, keyword: str) -> list:
+            # Naukri API parameters
+            params = {
+                "noOfResults": 50,
+                "urlType": "search_by_keyword",
+                "searchType": "adv",
+                "keyword": keyword,
+                "pageNo": 1,
+                "sort": "f",  # Sort by freshness
+                "seoKey": keyword.replace(" ", "-"),
+                "src": "jobsearchDesk",
+                "latLong": "",
             }
             
-            # Build client with custom headers
-            import httpx
-            async with httpx.AsyncClient(timeout=30, headers=headers) as client:
-                for keyword in keywords[:3]:
-                    try:
-                        # Naukri API parameters
-                        params = {
-                            "noOfResults": 50,
-                            "urlType": "search_by_keyword",
-                            "searchType": "adv",
-                            "keyword": keyword,
-                            "pageNo": 1,
-                            "sort": "f",  # Sort by freshness
-                            "seoKey": keyword.replace(" ", "-"),
-                            "src": "jobsearchDesk",
-                            "latLong": "",
-                        }
-                        
-                        response = await client.get(self.base_url, params=params)
-                        
-                        if response.status_code != 200:
-                            logger.warning(f"{self.name}: HTTP {response.status_code}")
-                            continue
-                        
-                        data = response.json()
-                        job_list = data.get('jobDetails', [])
-                        
-                        for job in job_list:
-                            job_id = job.get('jobId', '')
-                            if job_id in seen_ids:
-                                continue
-                            
-                            seen_ids.add(job_id)
-                            
-                            # Extract location
-                            placeholders = job.get('placeholders', [])
-                            location = 'India'
-                            for ph in placeholders:
-                                if ph.get('type') == 'location':
-                                    location = ph.get('label', 'India')
-                                    break
-                            
-                            # Extract experience
-                            experience = ''
-                            for ph in placeholders:
-                                if ph.get('type') == 'experience':
-                                    experience = ph.get('label', '')
-                                    break
-                            
-                            jobs.append(RawJob(
-                                title=job.get('title', 'Unknown'),
-                                company=job.get('companyName', 'Unknown'),
-                                location=location,
-                                description=job.get('jobDescription', ''),
-                                url=f"https://www.naukri.com{job.get('jdURL', '')}",
-                                source=self.name,
-                                posted=job.get('footerPlaceholderLabel', ''),
-                                salary=job.get('placeholders', [{}])[0].get('label', '') if job.get('placeholders') else '',
-                                job_type=experience,
-                                raw_data=job
-                            ))
-                        
-                        await asyncio.sleep(1.5)  # Rate limiting
-                        
-                    except Exception as e:
-                        logger.warning(f"{self.name}: Error for {keyword}: {str(e)[:100]}")
+            async with semaphore:
+                response = await _request(client, "GET", self.base_url, params=params, headers=NAUKRI_HEADERS)
+            
+            data = json_loads(response.content)
+            return data.get('jobDetails', [])
+        
+        try:
+            client = get_shared_client()
+            search_keywords = keywords[:3]
+            results = await asyncio.gather(
+                *(fetch_one(client, k) for k in search_keywords), return_exceptions=True
+            )
+            
+            for keyword, job_list in zip(search_keywords, results):
+                if isinstance(job_list, Exception):
+                    logger.warning(f"{self.name}: Error for {keyword}: {str(job_list)[:100]}")
+                    continue
+                
+                for job in job_list:
+                    job_id = job.get('jobId', '')
+                    if job_id in seen_ids:
                         continue
+                    
+                    seen_ids.add(job_id)
+                    
+                    # Placeholders are [{type: location|experience|salary, label: ...}]
+                    ph_by_type = {}
+                    for ph in job.get('placeholders') or ():
+                        ph_type = ph.get('type')
+                        if ph_type and ph_type not in ph_by_type:  # First one wins
+                            ph_by_type[ph_type] = ph.get('label', '')
+                    
+                    url = _NAUKRI_PREFIX + (job.get('jdURL') or '')
+                    if not self._claim_url(url, seen_urls):
+                        continue  # Already returned by another source
+                    
+                    jobs.append(RawJob(
+                        title=job.get('title', 'Unknown'),
+                        company=job.get('companyName', 'Unknown'),
+                        location=ph_by_type.get('location') or 'India',
+                        description=job.get('jobDescription', ''),
+                        url=url,
+                        source=self.name,
+                        posted=job.get('footerPlaceholderLabel', ''),
+                        salary=ph_by_type.get('salary', ''),
+                        job_type=ph_by_type.get('experience', ''),
+                        raw_data={"id": job.get('jobId')}
+                    ))
             
             logger.info(f"{self.name}: Found {len(jobs)} jobs")
             
         except Exception as e:
-            error = str(e)[:200]
+            error = _format_error(e)
             logger.error(f"{self.name}: {error}")
         
         return JobBatch(
@@ -132,65 +243,65 @@ class FounditSource(BaseJobSource):
     base_url = "https://www.foundit.in/middleware/jobsearch"
     rate_limit_seconds = 2.0
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
         seen_ids = set()
+        semaphore = asyncio.Semaphore(2)
         
-        try:
-            import httpx
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "application/json",
-                "Referer": "https://www.foundit.in/",
+        async def fetch_one(client, keyword: str) -> list:
+            params = {
+                "query": keyword,
+                "limit": 30,
+                "sort": "1",  # Sort by date
             }
             
-            async with httpx.AsyncClient(timeout=30, headers=headers) as client:
-                for keyword in keywords[:2]:
-                    try:
-                        params = {
-                            "query": keyword,
-                            "limit": 30,
-                            "sort": "1",  # Sort by date
-                        }
-                        
-                        response = await client.get(self.base_url, params=params)
-                        
-                        if response.status_code != 200:
-                            continue
-                        
-                        data = response.json()
-                        job_list = data.get('jobSearchResponse', {}).get('data', [])
-                        
-                        for job in job_list:
-                            job_id = job.get('jobId', '')
-                            if job_id in seen_ids:
-                                continue
-                            
-                            seen_ids.add(job_id)
-                            jobs.append(RawJob(
-                                title=job.get('title', 'Unknown'),
-                                company=job.get('companyName', 'Unknown'),
-                                location=job.get('locations', ['India'])[0] if job.get('locations') else 'India',
-                                description=job.get('jobDescription', ''),
-                                url=job.get('jobDetailUrl', ''),
-                                source=self.name,
-                                posted=job.get('postedDate', ''),
-                                salary=job.get('salary', ''),
-                                raw_data=job
-                            ))
-                        
-                        await asyncio.sleep(1.5)
-                        
-                    except Exception as e:
-                        logger.warning(f"{self.name}: Error for {keyword}: {str(e)[:100]}")
+            async with semaphore:
+                response = await _request(client, "GET", self.base_url, params=params, headers=FOUNDIT_HEADERS)
+            
+            data = json_loads(response.content)
+            return data.get('jobSearchResponse', {}).get('data', [])
+        
+        try:
+            client = get_shared_client()
+            search_keywords = keywords[:2]
+            results = await asyncio.gather(
+                *(fetch_one(client, k) for k in search_keywords), return_exceptions=True
+            )
+            
+            for keyword, job_list in zip(search_keywords, results):
+                if isinstance(job_list, Exception):
+                    logger.warning(f"{self.name}: Error for {keyword}: {str(job_list)[:100]}")
+                    continue
+                
+                for job in job_list:
+                    job_id = job.get('jobId', '')
+                    if job_id in seen_ids:
+                        continue
+                    
+                    seen_ids.add(job_id)
+                    
+                    url = job.get('jobDetailUrl', '')
+                    if not self._claim_url(url, seen_urls):
                         continue
+                    
+                    jobs.append(RawJob(
+                        title=job.get('title', 'Unknown'),
+                        company=job.get('companyName', 'Unknown'),
+                        location=job.get('locations', ['India'])[0] if job.get('locations') else 'India',
+                        description=job.get('jobDescription', ''),
+                        url=url,
+                        source=self.name,
+                        posted=job.get('postedDate', ''),
+                        salary=job.get('salary', ''),
+                        raw_data={"id": job.get('jobId')}
+                    ))
             
             logger.info(f"{self.name}: Found {len(jobs)} jobs")
             
         except Exception as e:
-            error = str(e)[:200]
+            error = _format_error(e)
             logger.error(f"{self.name}: {error}")
         
         return JobBatch(
@@ -210,63 +321,57 @@ class InstahyreSource(BaseJobSource):
     base_url = "https://www.instahyre.com/api/v1/search_jobs/"
     rate_limit_seconds = 2.0
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
+        seen_ids = set()
         
         try:
-            import httpx
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "application/json",
-                "Referer": "https://www.instahyre.com/",
+            client = get_shared_client()
+            
+            # Instahyre uses POST with filters; skills takes a list, so one request covers all keywords
+            payload = {
+                "job_type": "",
+                "min_experience": 0,
+                "max_experience": 5,
+                "location": ["pune", "mumbai", "bangalore", "hyderabad", "delhi"],
+                "skills": list(keywords[:5]),
+                "page": 1,
             }
             
-            async with httpx.AsyncClient(timeout=30, headers=headers) as client:
-                # Instahyre uses POST with filters
-                for keyword in keywords[:2]:
-                    try:
-                        payload = {
-                            "job_type": "",
-                            "min_experience": 0,
-                            "max_experience": 5,
-                            "location": ["pune", "mumbai", "bangalore", "hyderabad", "delhi"],
-                            "skills": [keyword],
-                            "page": 1,
-                        }
-                        
-                        response = await client.post(self.base_url, json=payload)
-                        
-                        if response.status_code != 200:
-                            continue
-                        
-                        data = response.json()
-                        job_list = data.get('jobs', [])
-                        
-                        for job in job_list:
-                            jobs.append(RawJob(
-                                title=job.get('title', 'Unknown'),
-                                company=job.get('company', {}).get('name', 'Unknown'),
-                                location=', '.join(job.get('locations', ['India'])),
-                                description=job.get('description', ''),
-                                url=f"https://www.instahyre.com/job/{job.get('slug', '')}",
-                                source=self.name,
-                                posted=job.get('created_at', ''),
-                                salary=job.get('salary_range', ''),
-                                raw_data=job
-                            ))
-                        
-                        await asyncio.sleep(1.5)
-                        
-                    except Exception as e:
-                        logger.warning(f"{self.name}: Error for {keyword}: {str(e)[:100]}")
+            response = await _request(client, "POST", self.base_url, json=payload, headers=INSTAHYRE_HEADERS)
+            data = json_loads(response.content)
+            
+            for job in data.get('jobs', []):
+                # A job tagged with several of the skills can be listed more than once
+                job_id = job.get('id')
+                if job_id is not None:
+                    if job_id in seen_ids:
                         continue
+                    seen_ids.add(job_id)
+                
+                slug = job.get('slug')
+                url = _INSTAHYRE_JOB_PREFIX + (slug or '')
+                if slug and not self._claim_url(url, seen_urls):
+                    continue
+                
+                jobs.append(RawJob(
+                    title=job.get('title', 'Unknown'),
+                    company=job.get('company', {}).get('name', 'Unknown'),
+                    location=', '.join(job.get('locations', ['India'])),
+                    description=job.get('description', ''),
+                    url=url,
+                    source=self.name,
+                    posted=job.get('created_at', ''),
+                    salary=job.get('salary_range', ''),
+                    raw_data={"id": job_id}
+                ))
             
             logger.info(f"{self.name}: Found {len(jobs)} jobs")
             
         except Exception as e:
-            error = str(e)[:200]
+            error = _format_error(e)
             logger.error(f"{self.name}: {error}")
         
         return JobBatch(
@@ -285,7 +390,7 @@ class CutshortSource(BaseJobSource):
     name = "Cutshort"
     base_url = "https://cutshort.io/api/public/jobs"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -299,7 +404,7 @@ class CutshortSource(BaseJobSource):
             if not response:
                 return JobBatch(source=self.name, error="Request failed")
             
-            data = response.json()
+            data = json_loads(response.content)
             job_list = data.get('jobs', data) if isinstance(data, dict) else data
             
             if isinstance(job_list, list):
@@ -309,17 +414,17 @@ class CutshortSource(BaseJobSource):
                         company=job.get('company', {}).get('name', 'Unknown') if isinstance(job.get('company'), dict) else 'Unknown',
                         location=job.get('location', 'India'),
                         description=job.get('description', ''),
-                        url=job.get('url', f"https://cutshort.io/job/{job.get('id', '')}"),
+                        url=job.get('url') or _CUTSHORT_JOB_PREFIX + str(job.get('id', '')),
                         source=self.name,
                         posted=job.get('posted_at', ''),
                         salary=job.get('salary', ''),
-                        raw_data=job
+                        raw_data={"id": job.get('id')}
                     ))
             
             logger.info(f"{self.name}: Found {len(jobs)} jobs")
             
         except Exception as e:
-            error = str(e)[:200]
+            error = _format_error(e)
             logger.error(f"{self.name}: {error}")
         
         return JobBatch(
@@ -337,52 +442,52 @@ class HiristSource(BaseJobSource):
     name = "Hirist"
     base_url = "https://www.hirist.tech/api/jobs/search"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
+        semaphore = asyncio.Semaphore(2)
+        
+        async def fetch_one(client, keyword: str) -> list:
+            params = {"q": keyword, "page": 1, "limit": 30}
+            
+            async with semaphore:
+                response = await _request(client, "GET", self.base_url, params=params, headers=HIRIST_HEADERS)
+            
+            data = json_loads(response.content)
+            return data.get('data', data.get('jobs', []))
         
         try:
-            import httpx
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "application/json",
-            }
+            client = get_shared_client()
+            results = await asyncio.gather(
+                *(fetch_one(client, k) for k in keywords[:2]), return_exceptions=True
+            )
             
-            async with httpx.AsyncClient(timeout=30, headers=headers) as client:
-                for keyword in keywords[:2]:
-                    try:
-                        params = {"q": keyword, "page": 1, "limit": 30}
-                        response = await client.get(self.base_url, params=params)
-                        
-                        if response.status_code != 200:
-                            continue
-                        
-                        data = response.json()
-                        job_list = data.get('data', data.get('jobs', []))
-                        
-                        for job in job_list:
-                            jobs.append(RawJob(
-                                title=job.get('title', job.get('designation', 'Unknown')),
-                                company=job.get('company', job.get('company_name', 'Unknown')),
-                                location=job.get('location', 'India'),
-                                description=job.get('description', job.get('job_description', '')),
-                                url=job.get('url', job.get('apply_url', '')),
-                                source=self.name,
-                                posted=job.get('posted_date', ''),
-                                raw_data=job
-                            ))
-                        
-                        await asyncio.sleep(1)
-                        
-                    except Exception as e:
-                        logger.warning(f"{self.name}: Error: {str(e)[:100]}")
+            for job_list in results:
+                if isinstance(job_list, Exception):
+                    logger.warning(f"{self.name}: Error: {str(job_list)[:100]}")
+                    continue
+                
+                for job in job_list:
+                    url = job.get('url', job.get('apply_url', ''))
+                    if not self._claim_url(url, seen_urls):
                         continue
+                    
+                    jobs.append(RawJob(
+                        title=job.get('title', job.get('designation', 'Unknown')),
+                        company=job.get('company', job.get('company_name', 'Unknown')),
+                        location=job.get('location', 'India'),
+                        description=job.get('description', job.get('job_description', '')),
+                        url=url,
+                        source=self.name,
+                        posted=job.get('posted_date', ''),
+                        raw_data={"id": job.get('id')}
+                    ))
             
             logger.info(f"{self.name}: Found {len(jobs)} jobs")
             
         except Exception as e:
-            error = str(e)[:200]
+            error = _format_error(e)
             logger.error(f"{self.name}: {error}")
         
         return JobBatch(
@@ -402,66 +507,79 @@ class LinkedInIndiaSource(BaseJobSource):
     base_url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
     rate_limit_seconds = 3.0
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    # Guest search pages hold 25 results each; read the first three pages
+    PAGE_SIZE = 25
+    PAGE_OFFSETS = tuple(range(0, 3 * PAGE_SIZE, PAGE_SIZE))
+    
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
+        semaphore = asyncio.Semaphore(4)
         
-        try:
-            import httpx
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "text/html,application/xhtml+xml",
+        async def fetch_page(client, keyword: str, offset: int) -> List[RawJob]:
+            params = {
+                "keywords": keyword,
+                "location": "India",
+                "f_TPR": "r86400",  # Last 24 hours
+                "start": offset,
             }
             
-            async with httpx.AsyncClient(timeout=30, headers=headers, follow_redirects=True) as client:
-                for keyword in keywords[:2]:
-                    try:
-                        params = {
-                            "keywords": keyword,
-                            "location": "India",
-                            "f_TPR": "r86400",  # Last 24 hours
-                            "start": 0,
-                        }
-                        
-                        response = await client.get(self.base_url, params=params)
-                        
-                        if response.status_code != 200:
-                            continue
-                        
-                        html = response.text
-                        
-                        # Parse job cards from HTML
-                        card_pattern = r'<li[^>]*>.*?<a[^>]*href="([^"]*linkedin\.com/jobs/view/[^"]*)"[^>]*>.*?<span[^>]*>([^<]+)</span>.*?<h4[^>]*>([^<]+)</h4>.*?<span[^>]*class="job-search-card__location"[^>]*>([^<]+)</span>.*?</li>'
-                        
-                        # Simpler extraction
-                        job_urls = re.findall(r'href="(https://www\.linkedin\.com/jobs/view/[^"]+)"', html)
-                        job_titles = re.findall(r'<span class="sr-only">([^<]+)</span>', html)
-                        
-                        for i, url in enumerate(job_urls[:20]):
-                            title = job_titles[i] if i < len(job_titles) else f"{keyword} position"
-                            
-                            jobs.append(RawJob(
-                                title=title,
-                                company='LinkedIn Listing',
-                                location='India',
-                                description=title,
-                                url=url.split('?')[0],
-                                source=self.name,
-                                posted='Recent',
-                                raw_data={"url": url}
-                            ))
-                        
-                        await asyncio.sleep(2)
-                        
-                    except Exception as e:
-                        logger.warning(f"{self.name}: Error: {str(e)[:100]}")
-                        continue
+            async with semaphore:
+                response = await _request(
+                    client, "GET", self.base_url, params=params,
+                    headers=LINKEDIN_HEADERS, follow_redirects=True
+                )
+            
+            html = response.content.decode('utf-8', 'replace')  # Always UTF-8; skip charset detection
+            
+            # Single scan collects job URLs and titles in document order
+            job_urls = []
+            job_titles = []
+            for match in _LI_CARD_RE.finditer(html):
+                url, title = match.groups()
+                if url:
+                    job_urls.append(url)
+                else:
+                    job_titles.append(title)
+            
+            page_jobs = []
+            for i, url in enumerate(job_urls[:self.PAGE_SIZE]):
+                title = job_titles[i] if i < len(job_titles) else f"{keyword} position"
+                
+                page_jobs.append(RawJob(
+                    title=title,
+                    company='LinkedIn Listing',
+                    location='India',
+                    description=title,
+                    url=url.split('?')[0],
+                    source=self.name,
+                    posted='Recent',
+                    raw_data={"url": url}
+                ))
+            return page_jobs
+        
+        try:
+            client = get_shared_client()
+            results = await asyncio.gather(
+                *(fetch_page(client, k, offset) for k in keywords[:2] for offset in self.PAGE_OFFSETS),
+                return_exceptions=True
+            )
+            
+            page_urls = set()  # Pages can overlap when new listings shift the offsets
+            for page_jobs in results:
+                if isinstance(page_jobs, Exception):
+                    logger.warning(f"{self.name}: Error: {str(page_jobs)[:100]}")
+                    continue
+                for job in page_jobs:
+                    if job.url not in page_urls:
+                        page_urls.add(job.url)
+                        jobs.append(job)
             
             logger.info(f"{self.name}: Found {len(jobs)} jobs")
             
         except Exception as e:
-            error = str(e)[:200]
+            error = _format_error(e)
             logger.error(f"{self.name}: {error}")
         
         return JobBatch(
@@ -482,21 +600,23 @@ class GoogleJobsSource(BaseJobSource):
     rate_limit_seconds = 1.0
     
     # Rotating keyword groups for comprehensive coverage
-    KEYWORD_GROUPS = [
-        ["data scientist", "machine learning engineer"],
-        ["data analyst", "business analyst"],
-        ["power bi developer", "tableau analyst"],
-        ["python developer data", "sql analyst"],
-        ["ai engineer", "nlp engineer"],
-        ["data engineer", "analytics engineer"],
-    ]
+    KEYWORD_GROUPS = (
+        ("data scientist", "machine learning engineer"),
+        ("data analyst", "business analyst"),
+        ("power bi developer", "tableau analyst"),
+        ("python developer data", "sql analyst"),
+        ("ai engineer", "nlp engineer"),
+        ("data engineer", "analytics engineer"),
+    )
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         from ..database.repository import db
         
         start = time.time()
         jobs = []
+        seen = set()  # (title, company) already added
         error = None
+        semaphore = asyncio.Semaphore(2)
         
         # Check quota
         usage = db.get_api_usage("serpapi")
@@ -509,10 +629,51 @@ class GoogleJobsSource(BaseJobSource):
         if not settings.serpapi.api_key:
             return JobBatch(source=self.name, error="SERPAPI_KEY not configured")
         
-        try:
-            import httpx
-            from datetime import datetime
+        # "today" results don't change until midnight, so re-runs reuse them
+        now = datetime.now()
+        today = now.date()
+        midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        seconds_until_midnight = int((midnight - now).total_seconds())
+        api_calls = 0  # Searches charged this run; recorded in one DB write at the end
+        
+        async def fetch_one(client, keyword: str) -> list:
+            nonlocal api_calls
+            cache_key = f"serpapi:jobs:{today.isoformat()}:{keyword}"
+            cached = db.get_cached_response(cache_key)
+            if cached is not None:
+                return json_loads(cached).get('jobs_results', [])  # No API call, no quota used
+            
+            if api_calls >= remaining:
+                return []  # Would exceed the monthly quota
+            
+            params = {
+                "engine": "google_jobs",
+                "q": f"{keyword} jobs",
+                "location": "India",
+                "hl": "en",
+                "gl": "in",
+                "chips": "date_posted:today",  # Fresh jobs only (last 24h)
+                "api_key": settings.serpapi.api_key
+            }
             
+            api_calls += 1  # Reserve before awaiting so concurrent keywords can't overshoot
+            try:
+                async with semaphore:
+                    response = await _request(
+                        client, "GET", "https://serpapi.com/search", params=params, headers=JSON_API_HEADERS
+                    )
+            except Exception:
+                api_calls -= 1  # Failed searches aren't charged
+                raise
+            
+            logger.debug(f"{self.name}: content-encoding={response.headers.get('content-encoding', 'none')}")
+            
+            db.set_cached_response(cache_key, response.content, max(seconds_until_midnight, 1))
+            
+            data = json_loads(response.content)
+            return data.get('jobs_results', [])
+        
+        try:
             # Smart rotation: use day of month to rotate through keyword groups
             day = datetime.now().day
             group_index = day % len(self.KEYWORD_GROUPS)
@@ -520,7 +681,7 @@ class GoogleJobsSource(BaseJobSource):
             
             # Also add first keyword from user's list if different
             if keywords and keywords[0].lower() not in [k.lower() for k in search_keywords]:
-                search_keywords = [keywords[0]] + search_keywords[:1]
+                search_keywords = (keywords[0],) + search_keywords[:1]
             
             # Limit API calls based on remaining quota
             max_searches = min(3, remaining)  # Max 3 searches per run
@@ -528,72 +689,59 @@ class GoogleJobsSource(BaseJobSource):
             
             logger.info(f"{self.name}: Searching {len(search_keywords)} keywords: {search_keywords}")
             
-            async with httpx.AsyncClient(timeout=30) as client:
-                for keyword in search_keywords:
-                    params = {
-                        "engine": "google_jobs",
-                        "q": f"{keyword} jobs",
-                        "location": "India",
-                        "hl": "en",
-                        "gl": "in",
-                        "chips": "date_posted:today",  # Fresh jobs only (last 24h)
-                        "api_key": settings.serpapi.api_key
-                    }
-                    
-                    response = await client.get("https://serpapi.com/search", params=params)
+            client = get_shared_client()
+            results = await asyncio.gather(
+                *(fetch_one(client, k) for k in search_keywords), return_exceptions=True
+            )
+            
+            # Track usage
+            if api_calls:
+                db.increment_api_usage("serpapi", count=api_calls)
+            
+            for keyword, job_results in zip(search_keywords, results):
+                if isinstance(job_results, Exception):
+                    logger.warning(f"{self.name}: Error for '{keyword}': {str(job_results)[:100]}")
+                    continue
+                
+                for job in job_results[:15]:  # Top 15 per keyword
+                    title = job.get('title', 'Unknown')
+                    company = job.get('company_name', 'Unknown')
                     
-                    if response.status_code != 200:
-                        logger.warning(f"{self.name}: HTTP {response.status_code} for '{keyword}'")
+                    # Same posting often comes back for several keywords
+                    key = (title.lower(), company.lower())
+                    if key in seen:
                         continue
+                    seen.add(key)
                     
-                    # Track usage
-                    db.increment_api_usage("serpapi")
-                    
-                    data = response.json()
-                    job_results = data.get('jobs_results', [])
+                    # Get apply link
+                    apply_options = job.get('apply_options', [])
+                    url = apply_options[0].get('link', '') if apply_options else job.get('share_link', '')
+                    if not self._claim_url(url, seen_urls):
+                        continue
                     
-                    for job in job_results[:15]:  # Top 15 per keyword
-                        # Get apply link
-                        apply_options = job.get('apply_options', [])
-                        url = apply_options[0].get('link', '') if apply_options else job.get('share_link', '')
-                        
-                        # Get job metadata
-                        detected_extensions = job.get('detected_extensions', {})
-                        posted = detected_extensions.get('posted_at', '')
-                        schedule = detected_extensions.get('schedule_type', '')
-                        salary = detected_extensions.get('salary', '')
-                        
-                        jobs.append(RawJob(
-                            title=job.get('title', 'Unknown'),
-                            company=job.get('company_name', 'Unknown'),
-                            location=job.get('location', 'India'),
-                            description=job.get('description', '')[:2000],
-                            url=url,
-                            source=self.name,
-                            posted=posted,
-                            salary=salary,
-                            job_type=schedule,
-                            raw_data=job
-                        ))
+                    # Get job metadata
+                    detected_extensions = job.get('detected_extensions', {})
+                    posted = detected_extensions.get('posted_at', '')
+                    schedule = detected_extensions.get('schedule_type', '')
+                    salary = detected_extensions.get('salary', '')
                     
-                    # Rate limit between searches
-                    await asyncio.sleep(0.5)
-            
-            # Remove duplicates by title+company
-            seen = set()
-            unique_jobs = []
-            for job in jobs:
-                key = f"{job.title.lower()}|{job.company.lower()}"
-                if key not in seen:
-                    seen.add(key)
-                    unique_jobs.append(job)
-            jobs = unique_jobs
+                    jobs.append(RawJob(
+                        title=title,
+                        company=company,
+                        location=job.get('location', 'India'),
+                        description=job.get('description', '')[:2000],
+                        url=url,
+                        source=self.name,
+                        posted=posted,
+                        salary=salary,
+                        job_type=schedule,
+                        raw_data={"id": job.get('job_id')}
+                    ))
             
-            new_usage = db.get_api_usage("serpapi")
-            logger.info(f"{self.name}: Found {len(jobs)} unique jobs (API: {new_usage}/{settings.serpapi.monthly_limit})")
+            logger.info(f"{self.name}: Found {len(jobs)} unique jobs (API: {usage + api_calls}/{settings.serpapi.monthly_limit})")
             
         except Exception as e:
-            error = str(e)[:200]
+            error = _format_error(e)
             logger.error(f"{self.name}: {error}")
         
         return JobBatch(
@@ -611,7 +759,7 @@ class GoogleJobsDirectSource(BaseJobSource):
     """
     name = "Google-Jobs-Free"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         # Google blocks direct scraping with CAPTCHA
         return JobBatch(
             source=self.name, 
@@ -629,78 +777,76 @@ class GreenhouseMultiSource(BaseJobSource):
     rate_limit_seconds = 0.5
     
     # Top companies using Greenhouse with India/Remote jobs
-    COMPANIES = [
+    COMPANIES = (
         "airbnb", "pinterest", "cloudflare", "stripe", "figma",
         "discord", "instacart", "coinbase", "databricks", "notion",
         "gitlab", "elastic", "hashicorp", "datadog", "confluent",
         "mongodb", "snowflake", "plaid", "brex", "ramp",
-    ]
+    )
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
-        keywords_lower = [k.lower() for k in keywords]
+        is_relevant_title = build_keyword_matcher(k.lower() for k in keywords)
+        semaphore = asyncio.Semaphore(5)
         
-        try:
-            import httpx
+        async def _fetch_company(client, company: str) -> List[RawJob]:
+            url = f"https://boards-api.greenhouse.io/v1/boards/{company}/jobs"
+            async with semaphore:
+                data = await _cached_get(
+                    client, f"greenhouse:{company}:jobs", url,
+                    headers=JSON_API_HEADERS, timeout=15
+                )
+            company_jobs = data.get('jobs', [])
             
-            async with httpx.AsyncClient(timeout=15) as client:
-                # Rotate through 5 companies per run to stay fast
-                hour = datetime.now().hour
-                start_idx = (hour % 4) * 5
-                companies_to_check = self.COMPANIES[start_idx:start_idx+5]
-                
-                logger.info(f"{self.name}: Checking {companies_to_check}")
+            company_matches = []
+            for job in company_jobs:
+                title = job.get('title', '').lower()
+                location = job.get('location', {}).get('name', '')
                 
-                for company in companies_to_check:
-                    try:
-                        url = f"https://boards-api.greenhouse.io/v1/boards/{company}/jobs"
-                        response = await client.get(url)
-                        
-                        if response.status_code != 200:
-                            continue
-                        
-                        data = response.json()
-                        company_jobs = data.get('jobs', [])
-                        
-                        for job in company_jobs:
-                            title = job.get('title', '').lower()
-                            location = job.get('location', {}).get('name', '')
-                            
-                            # Filter for relevant jobs (data/analytics/ML)
-                            is_relevant = any(kw in title for kw in keywords_lower)
-                            
-                            # Filter for India or Remote
-                            location_lower = location.lower()
-                            is_india_remote = any(loc in location_lower for loc in [
-                                'india', 'bangalore', 'bengaluru', 'mumbai', 'pune', 
-                                'hyderabad', 'delhi', 'gurgaon', 'noida', 'chennai',
-                                'remote', 'anywhere', 'worldwide', 'global'
-                            ])
-                            
-                            if is_relevant and is_india_remote:
-                                jobs.append(RawJob(
-                                    title=job.get('title', 'Unknown'),
-                                    company=company.title(),
-                                    location=location,
-                                    description="",  # Need separate API call for description
-                                    url=job.get('absolute_url', ''),
-                                    source=self.name,
-                                    posted=job.get('updated_at', ''),
-                                    job_type="",
-                                ))
-                        
-                        await asyncio.sleep(0.3)
-                        
-                    except Exception as e:
-                        logger.debug(f"{self.name}: Error fetching {company}: {e}")
+                # Filter for relevant jobs (data/analytics/ML) in India or Remote
+                if is_relevant_title(title) and _INDIA_REMOTE_MATCHER(location.lower()):
+                    url = job.get('absolute_url', '')
+                    if not self._claim_url(url, seen_urls):
                         continue
+                    
+                    company_matches.append(RawJob(
+                        title=job.get('title', 'Unknown'),
+                        company=company.title(),
+                        location=location,
+                        description="",  # Need separate API call for description
+                        url=url,
+                        source=self.name,
+                        posted=job.get('updated_at', ''),
+                        job_type="",
+                    ))
+            return company_matches
+        
+        try:
+            client = get_shared_client()
+            
+            # Rotate through 5 companies per run to stay fast
+            hour = datetime.now().hour
+            start_idx = (hour % 4) * 5
+            companies_to_check = self.COMPANIES[start_idx:start_idx+5]
+            
+            logger.info(f"{self.name}: Checking {companies_to_check}")
+            
+            results = await asyncio.gather(
+                *(_fetch_company(client, c) for c in companies_to_check), return_exceptions=True
+            )
+            
+            for company, result in zip(companies_to_check, results):
+                if isinstance(result, Exception):
+                    logger.debug(f"{self.name}: Error fetching {company}: {result}")
+                    continue
+                jobs.extend(result)
             
             logger.info(f"{self.name}: Found {len(jobs)} jobs (FREE - no API key)")
             
         except Exception as e:
-            error = str(e)[:200]
+            error = _format_error(e)
             logger.error(f"{self.name}: {error}")
         
         return JobBatch(
@@ -719,46 +865,52 @@ class WorkingNomadsSource(BaseJobSource):
     name = "WorkingNomads"
     base_url = "https://www.workingnomads.com/api/exposed_jobs/"
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
-        keywords_lower = [k.lower() for k in keywords]
+        is_keyword_match = build_keyword_matcher(k.lower() for k in keywords)
         
-        try:
-            import httpx
+        def add_if_relevant(job: dict):
+            raw_title = job.get('title') or ''
+            raw_category = job.get('category_name') or ''
             
-            async with httpx.AsyncClient(timeout=20) as client:
-                response = await client.get(self.base_url)
-                
+            # Filter for relevant jobs (each field lowered once)
+            is_relevant = is_keyword_match(raw_title.lower()) or is_keyword_match(raw_category.lower())
+            
+            if is_relevant:
+                jobs.append(RawJob(
+                    title=raw_title or 'Unknown',
+                    company=job.get('company_name', 'Unknown'),
+                    location=job.get('location', 'Remote'),
+                    description=job.get('description', '')[:2000],
+                    url=job.get('url', ''),
+                    source=self.name,
+                    posted=job.get('pub_date', ''),
+                    job_type=raw_category,
+                ))
+        
+        try:
+            client = get_shared_client()
+            async with client.stream("GET", self.base_url, headers=JSON_API_HEADERS, timeout=20) as response:
                 if response.status_code != 200:
                     return JobBatch(source=self.name, error=f"HTTP {response.status_code}")
                 
-                data = response.json()
+                logger.debug(f"{self.name}: content-encoding={response.headers.get('content-encoding', 'none')}")
                 
-                for job in data:
-                    title = job.get('title', '').lower()
-                    category = job.get('category_name', '').lower()
-                    
-                    # Filter for relevant jobs
-                    is_relevant = any(kw in title or kw in category for kw in keywords_lower)
-                    
-                    if is_relevant:
-                        jobs.append(RawJob(
-                            title=job.get('title', 'Unknown'),
-                            company=job.get('company_name', 'Unknown'),
-                            location=job.get('location', 'Remote'),
-                            description=job.get('description', '')[:2000],
-                            url=job.get('url', ''),
-                            source=self.name,
-                            posted=job.get('pub_date', ''),
-                            job_type=job.get('category_name', ''),
-                        ))
+                if ijson is not None:
+                    # Feed is one big array; decode and filter one job at a time
+                    reader = _AsyncByteReader(response.aiter_bytes())
+                    async for job in ijson.items_async(reader, 'item'):
+                        add_if_relevant(job)
+                else:
+                    for job in json_loads(await response.aread()):
+                        add_if_relevant(job)
             
             logger.info(f"{self.name}: Found {len(jobs)} remote jobs (FREE - no API key)")
             
         except Exception as e:
-            error = str(e)[:200]
+            error = _format_error(e)
             logger.error(f"{self.name}: {error}")
         
         return JobBatch(
@@ -769,6 +921,85 @@ class WorkingNomadsSource(BaseJobSource):
         )
 
 
+class _AdzunaRow(NamedTuple):
+    """Fields kept from one Adzuna search result"""
+    title: str
+    company: str
+    location: str
+    description: str
+    url: str
+    posted: str
+    salary: str
+    job_type: str
+
+
+if msgspec is not None:
+    class _AdzunaName(msgspec.Struct):
+        display_name: Optional[str] = None
+    
+    class _AdzunaResult(msgspec.Struct):
+        title: Optional[str] = None
+        company: Optional[_AdzunaName] = None
+        location: Optional[_AdzunaName] = None
+        description: Optional[str] = None
+        redirect_url: Optional[str] = None
+        created: Optional[str] = None
+        salary_min: Optional[Union[int, float]] = None  # Keep ints as ints, like json_loads
+        contract_type: Optional[str] = None
+    
+    class _AdzunaPage(msgspec.Struct):
+        results: List[_AdzunaResult] = []
+    
+    _adzuna_decoder = msgspec.json.Decoder(_AdzunaPage)
+
+
+def _parse_adzuna_page(content: bytes) -> List[_AdzunaRow]:
+    """
+    Decode an Adzuna search response into rows.
+    Uses typed msgspec structs when installed (no per-result dicts), else json_loads().
+    A page msgspec rejects (a field with an unexpected type) is re-read with json_loads().
+    """
+    rows = []
+    if msgspec is not None:
+        try:
+            page = _adzuna_decoder.decode(content)
+        except msgspec.ValidationError as e:
+            logger.debug(f"Adzuna: typed decode failed ({e}), falling back to json_loads")
+            page = None
+    else:
+        page = None
+    
+    if page is not None:
+        for r in page.results:
+            rows.append(_AdzunaRow(
+                title=r.title or 'Unknown',
+                company=(r.company.display_name if r.company else None) or 'Unknown',
+                location=(r.location.display_name if r.location else None) or 'India',
+                description=(r.description or '')[:2000],
+                url=r.redirect_url or '',
+                posted=r.created or '',
+                salary=str(r.salary_min) if r.salary_min is not None else '',
+                job_type=r.contract_type or '',
+            ))
+        return rows
+    
+    for job in json_loads(content).get('results', []):
+        company_info = job.get('company')
+        location_info = job.get('location')
+        salary_min = job.get('salary_min')
+        rows.append(_AdzunaRow(
+            title=job.get('title') or 'Unknown',
+            company=(company_info.get('display_name') if isinstance(company_info, dict) else None) or 'Unknown',
+            location=(location_info.get('display_name') if isinstance(location_info, dict) else None) or 'India',
+            description=(job.get('description') or '')[:2000],
+            url=job.get('redirect_url') or '',
+            posted=job.get('created') or '',
+            salary=str(salary_min) if salary_min is not None else '',
+            job_type=job.get('contract_type') or '',
+        ))
+    return rows
+
+
 class AdzunaIndiaSource(BaseJobSource):
     """
     Adzuna API - FREE tier with 1000 calls/month!
@@ -778,85 +1009,96 @@ class AdzunaIndiaSource(BaseJobSource):
     name = "Adzuna-India"
     base_url = "https://api.adzuna.com/v1/api/jobs/in/search/1"
     rate_limit_seconds = 1.0
+    max_jobs = int(getattr(settings, 'adzuna_max_jobs', 60))  # Stop collecting once reached
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
-        start = time.time()
-        jobs = []
-        error = None
-        
-        # Check for API credentials
-        app_id = settings.adzuna_app_id if hasattr(settings, 'adzuna_app_id') else None
-        app_key = settings.adzuna_app_key if hasattr(settings, 'adzuna_app_key') else None
-        
+    def __init__(self):
+        super().__init__()
+        # Resolve API credentials once (settings first, then environment variables)
+        app_id = getattr(settings, 'adzuna_app_id', None)
+        app_key = getattr(settings, 'adzuna_app_key', None)
         if not app_id or not app_key:
-            # Try environment variables
-            import os
             app_id = os.getenv('ADZUNA_APP_ID')
             app_key = os.getenv('ADZUNA_APP_KEY')
+        self._app_id = app_id
+        self._app_key = app_key
+    
+    @property
+    def is_configured(self) -> bool:
+        return bool(self._app_id and self._app_key)
+    
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
+        start = time.time()
+        jobs = []
+        seen = set()  # (title, company) already added
+        error = None
         
-        if not app_id or not app_key:
+        if not self.is_configured:
             return JobBatch(
                 source=self.name, 
                 error="ADZUNA_APP_ID and ADZUNA_APP_KEY not configured. Sign up free at https://developer.adzuna.com/"
             )
         
         try:
-            import httpx
-            
             # Search with multiple keywords
             search_terms = keywords[:3] if keywords else ["data analyst", "data scientist"]
             
-            async with httpx.AsyncClient(timeout=30) as client:
-                for term in search_terms:
-                    params = {
-                        "app_id": app_id,
-                        "app_key": app_key,
-                        "results_per_page": 20,
-                        "what": term,
-                        "where": "India",
-                        "max_days_old": 1,  # Only last 24 hours
-                        "sort_by": "date",
-                        "content-type": "application/json",
-                    }
-                    
-                    response = await client.get(self.base_url, params=params)
-                    
-                    if response.status_code != 200:
-                        logger.warning(f"{self.name}: HTTP {response.status_code} for '{term}'")
+            async def fetch_term(client, term: str) -> List[_AdzunaRow]:
+                params = {
+                    "app_id": self._app_id,
+                    "app_key": self._app_key,
+                    "results_per_page": 20,
+                    "what": term,
+                    "where": "India",
+                    "max_days_old": 1,  # Only last 24 hours
+                    "sort_by": "date",
+                    "content-type": "application/json",
+                }
+                
+                response = await client.get(self.base_url, params=params)
+                
+                if response.status_code != 200:
+                    logger.warning(f"{self.name}: HTTP {response.status_code} for '{term}'")
+                    return []
+                
+                return _parse_adzuna_page(response.content)
+            
+            client = get_shared_client()
+            term_results = await asyncio.gather(
+                *(fetch_term(client, term) for term in search_terms), return_exceptions=True
+            )
+            
+            for term, results in zip(search_terms, term_results):
+                if len(jobs) >= self.max_jobs:
+                    break
+                if isinstance(results, Exception):
+                    logger.warning(f"{self.name}: Error for '{term}': {str(results)[:100]}")
+                    continue
+                
+                for row in results:
+                    # Skip duplicates before building the RawJob
+                    key = (row.title.lower(), row.company.lower())
+                    if key in seen:
                         continue
-                    
-                    data = response.json()
-                    results = data.get('results', [])
-                    
-                    for job in results:
-                        jobs.append(RawJob(
-                            title=job.get('title', 'Unknown'),
-                            company=job.get('company', {}).get('display_name', 'Unknown'),
-                            location=job.get('location', {}).get('display_name', 'India'),
-                            description=job.get('description', '')[:2000],
-                            url=job.get('redirect_url', ''),
-                            source=self.name,
-                            posted=job.get('created', ''),
-                            salary=job.get('salary_min', ''),
-                            job_type=job.get('contract_type', ''),
-                        ))
-                    
-                    await asyncio.sleep(0.3)
-            
-            # Deduplicate
-            seen = set()
-            unique_jobs = []
-            for job in jobs:
-                key = f"{job.title.lower()}|{job.company.lower()}"
-                if key not in seen:
                     seen.add(key)
-                    unique_jobs.append(job)
-            jobs = unique_jobs
+                    
+                    jobs.append(RawJob(
+                        title=row.title,
+                        company=row.company,
+                        location=row.location,
+                        description=row.description,
+                        url=row.url,
+                        source=self.name,
+                        posted=row.posted,
+                        salary=row.salary,
+                        job_type=row.job_type,
+                    ))
+                    if len(jobs) >= self.max_jobs:
+                        break
             
             logger.info(f"{self.name}: Found {len(jobs)} unique jobs (FREE API)")
             
         except Exception as e:
-            error = str(e)[:200]
+            error = _format_error(e)
             logger.error(f"{self.name}: {error}")
         
         return JobBatch(
@@ -867,6 +1109,48 @@ class AdzunaIndiaSource(BaseJobSource):
         )
 
 
+# Warm Chromium shared across scans (launching one costs a few seconds)
+_playwright = None
+_browser = None
+
+
+async def _get_browser():
+    """Get the shared headless Chromium, launching it on first use"""
+    global _playwright, _browser
+    if _browser is None or not _browser.is_connected():
+        from playwright.async_api import async_playwright
+        
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+        _browser = await _playwright.chromium.launch(headless=True)
+    return _browser
+
+
+async def close_browser():
+    """Shut down the shared browser (call once at shutdown)"""
+    global _playwright, _browser
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+
+# Extracts the first 20 Indeed result cards in the page (missing fields come back as "")
+_INDEED_CARDS_JS = """() => Array.from(document.querySelectorAll('.job_seen_beacon, [data-jk]')).slice(0, 20).map(c => {
+    const titleEl = c.querySelector('h2.jobTitle a, .jobTitle a');
+    const text = sel => c.querySelector(sel)?.innerText || '';
+    return {
+        title: titleEl?.innerText || '',
+        href: titleEl?.getAttribute('href') || '',
+        company: text("[data-testid='company-name'], .companyName"),
+        location: text("[data-testid='text-location'], .companyLocation"),
+        posted: text('.date, .result-footer'),
+    };
+})"""
+
+
 class IndeedIndiaPlaywrightSource(BaseJobSource):
     """
     Indeed India scraper using Playwright for stealth.
@@ -875,79 +1159,79 @@ class IndeedIndiaPlaywrightSource(BaseJobSource):
     name = "Indeed-India"
     rate_limit_seconds = 3.0
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
         
         try:
-            from playwright.async_api import async_playwright
-            
             try:
                 from playwright_stealth import Stealth
                 has_stealth = True
             except ImportError:
                 has_stealth = False
             
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
+            browser = await _get_browser()
+            
+            async def scan(keyword: str) -> List[RawJob]:
+                # Separate context per keyword so the searches run side by side
                 context = await browser.new_context(
                     user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                 )
-                page = await context.new_page()
-                
-                if has_stealth:
-                    stealth = Stealth()
-                    await stealth.apply_stealth_async(page)
-                
-                seen_ids = set()
+                try:
+                    page = await context.new_page()
+                    
+                    if has_stealth:
+                        stealth = Stealth()
+                        await stealth.apply_stealth_async(page)
+                    
+                    # fromage=1 = last 24 hours, sort=date
+                    search_url = f"https://in.indeed.com/jobs?q={keyword}&l=India&sort=date&fromage=1"
+                    await page.goto(search_url, timeout=30000)
+                    await page.wait_for_timeout(2000)
+                    
+                    # One round-trip for all cards instead of ~9 per card
+                    cards = await page.evaluate(_INDEED_CARDS_JS)
+                    
+                    keyword_jobs = []
+                    for card in cards:
+                        href = card['href']
+                        url = f"https://in.indeed.com{href}" if href and not href.startswith("http") else href
+                        keyword_jobs.append((
+                            card['title'] or "Unknown",
+                            card['company'] or "Unknown",
+                            card['location'] or "India",
+                            card['posted'] or "Today",
+                            url,
+                        ))
+                    return keyword_jobs
+                finally:
+                    await context.close()  # Browser stays warm for the next scan
+            
+            search_keywords = keywords[:2]
+            results = await asyncio.gather(*(scan(k) for k in search_keywords), return_exceptions=True)
+            
+            seen_ids = set()
+            for keyword, keyword_jobs in zip(search_keywords, results):
+                if isinstance(keyword_jobs, Exception):
+                    logger.warning(f"{self.name}: Error for {keyword}: {str(keyword_jobs)[:100]}")
+                    continue
                 
-                for keyword in keywords[:2]:
-                    try:
-                        # fromage=1 = last 24 hours, sort=date
-                        search_url = f"https://in.indeed.com/jobs?q={keyword}&l=India&sort=date&fromage=1"
-                        await page.goto(search_url, timeout=30000)
-                        await page.wait_for_timeout(2000)
-                        
-                        job_cards = await page.query_selector_all(".job_seen_beacon, [data-jk]")
-                        
-                        for card in job_cards[:20]:
-                            try:
-                                title_el = await card.query_selector("h2.jobTitle a, .jobTitle a")
-                                company_el = await card.query_selector("[data-testid='company-name'], .companyName")
-                                location_el = await card.query_selector("[data-testid='text-location'], .companyLocation")
-                                date_el = await card.query_selector(".date, .result-footer")
-                                
-                                title = await title_el.inner_text() if title_el else "Unknown"
-                                company = await company_el.inner_text() if company_el else "Unknown"
-                                location = await location_el.inner_text() if location_el else "India"
-                                posted = await date_el.inner_text() if date_el else "Today"
-                                
-                                href = await title_el.get_attribute("href") if title_el else ""
-                                url = f"https://in.indeed.com{href}" if href and not href.startswith("http") else href
-                                
-                                job_key = f"{title}_{company}"
-                                if job_key not in seen_ids and title != "Unknown":
-                                    seen_ids.add(job_key)
-                                    jobs.append(RawJob(
-                                        title=title[:100],
-                                        company=company[:50] if company else 'Unknown',
-                                        location=location,
-                                        description=f"{title} at {company}",
-                                        url=url,
-                                        source=self.name,
-                                        posted=posted
-                                    ))
-                            except Exception as e:
-                                continue
-                        
-                        await page.wait_for_timeout(2000)
-                        
-                    except Exception as e:
-                        logger.warning(f"{self.name}: Error for {keyword}: {str(e)[:100]}")
+                for title, company, location, posted, url in keyword_jobs:
+                    job_key = (title, company)
+                    if job_key in seen_ids or title == "Unknown":
                         continue
-                
-                await browser.close()
+                    seen_ids.add(job_key)
+                    
+                    jobs.append(RawJob(
+                        title=title[:100],
+                        company=company[:50] if company else 'Unknown',
+                        location=location,
+                        description=f"{title} at {company}",
+                        url=url,
+                        source=self.name,
+                        posted=posted
+                    ))
             
             logger.info(f"{self.name}: Found {len(jobs)} jobs")
             
@@ -955,7 +1239,7 @@ class IndeedIndiaPlaywrightSource(BaseJobSource):
             error = "Playwright not installed. Run: pip install playwright playwright-stealth && playwright install chromium"
             logger.warning(f"{self.name}: {error}")
         except Exception as e:
-            error = str(e)[:200]
+            error = _format_error(e)
             logger.error(f"{self.name}: {error}")
         
         return JobBatch(
@@ -989,7 +1273,7 @@ class PuneTechCompaniesSource(BaseJobSource):
         },
     ]
     
-    async def fetch_jobs(self, keywords: List[str]) -> JobBatch:
+    async def fetch_jobs(self, keywords: List[str], seen_urls: Optional[Set[str]] = None) -> JobBatch:
         start = time.time()
         jobs = []
         error = None
@@ -1,4 +1,8 @@
 """Utilities module"""
 from .notifications import TelegramNotifier, ConsoleNotifier, get_telegram_notifier, get_console_notifier
+from .http import request_with_retry, get_shared_client, close_shared_client
 
-__all__ = ["TelegramNotifier", "ConsoleNotifier", "get_telegram_notifier", "get_console_notifier"]
+__all__ = [
+    "TelegramNotifier", "ConsoleNotifier", "get_telegram_notifier", "get_console_notifier",
+    "request_with_retry", "get_shared_client", "close_shared_client"
+]
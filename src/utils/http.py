@@ -0,0 +1,78 @@
+"""
+Shared HTTP helpers for sources and notifiers.
+"""
+
+import asyncio
+import random
+from typing import Optional
+import logging
+
+import httpx
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401 - lets httpx decode "br" responses
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Only advertise brotli when we can decode it
+ACCEPT_ENCODING = "gzip, br" if BROTLI_AVAILABLE else "gzip"
+
+logger = logging.getLogger(__name__)
+
+
+async def request_with_retry(client: httpx.AsyncClient, method: str, url: str,
+                             attempts: int = 3, backoff: float = 0.2,
+                             max_backoff: float = 1.0, jitter: float = 0.0,
+                             **kwargs) -> httpx.Response:
+    """
+    Send a request, retrying transport errors and 5xx responses with exponential backoff
+    (plus up to `jitter` random seconds, so concurrent callers don't retry in lockstep).
+    Returns the response once it is 2xx; raises httpx.HTTPStatusError for 4xx
+    immediately and for 5xx after the last attempt.
+    """
+    for attempt in range(attempts):
+        try:
+            response = await client.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code < 500 or attempt == attempts - 1:
+                raise
+        except httpx.TransportError:
+            if attempt == attempts - 1:
+                raise
+        
+        delay = min(max_backoff, backoff * (2 ** attempt) + random.uniform(0, jitter))
+        logger.debug(f"Retrying {method} {url} in {delay:.1f}s (attempt {attempt + 2}/{attempts})")
+        await asyncio.sleep(delay)
+
+
+# Global instance
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the pooled client shared by all sources (keeps TLS connections alive between calls)"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            http2=HTTP2_AVAILABLE,
+        )
+    return _client
+
+
+async def close_shared_client():
+    """Close the shared client (call once at shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
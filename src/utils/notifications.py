@@ -3,6 +3,8 @@ Notification services (Telegram, console, etc.)
 """
 
 import asyncio
+import urllib.parse
+from functools import cache
 from typing import List, Optional
 from datetime import datetime
 import logging
@@ -11,9 +13,21 @@ import httpx
 
 from ..database.models import ProcessedJob, NotificationPayload
 from ..config.settings import settings
+from .http import HTTP2_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+_FORM_HEADERS = {"content-type": "application/x-www-form-urlencoded"}
+
+# Category tags for job alerts
+_CATEGORY_TAGS = {
+    "Data Science": "🧪 DS",
+    "Data Analytics": "📊 DA",
+    "ML Engineering": "🤖 ML",
+    "BI Developer": "📈 BI",
+    "Data Engineering": "⚙️ DE",
+}
+
 
 class TelegramNotifier:
     """Send job alerts to Telegram"""
@@ -22,11 +36,34 @@ class TelegramNotifier:
         self.token = settings.telegram.token
         self.chat_id = settings.telegram.chat_id
         self.base_url = f"https://api.telegram.org/bot{self.token}" if self.token else None
+        self._client: Optional[httpx.AsyncClient] = None
+        # sendMessage fields shared by every job alert, form-encoded once
+        self._job_form = urllib.parse.urlencode({
+            "chat_id": self.chat_id,
+            "parse_mode": "HTML",
+            "disable_web_page_preview": "false"
+        }).encode()
     
     @property
     def is_configured(self) -> bool:
         return settings.telegram.is_configured
     
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the client reused for all Bot API calls"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=15,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=10),
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the HTTP client"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+    
     async def test_connection(self) -> bool:
         """Test Telegram bot connection"""
         if not self.is_configured:
@@ -34,18 +71,18 @@ class TelegramNotifier:
             return False
         
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(f"{self.base_url}/getMe")
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('ok'):
-                        bot_name = data['result'].get('username', 'Unknown')
-                        logger.info(f"Telegram connected: @{bot_name}")
-                        return True
-                
-                logger.error(f"Telegram verification failed: {response.status_code}")
-                return False
+            client = await self._get_client()
+            response = await client.get(f"{self.base_url}/getMe", timeout=10)
+            
+            if response.status_code == 200:
+                data = response.json()
+                if data.get('ok'):
+                    bot_name = data['result'].get('username', 'Unknown')
+                    logger.info(f"Telegram connected: @{bot_name}")
+                    return True
+            
+            logger.error(f"Telegram verification failed: {response.status_code}")
+            return False
         except Exception as e:
             logger.error(f"Telegram connection error: {e}")
             return False
@@ -53,22 +90,11 @@ class TelegramNotifier:
     def _format_job_message(self, job: ProcessedJob) -> str:
         """Format job for Telegram message"""
         # Score emoji
-        if job.combined_score >= 0.7:
-            score_emoji = "🔥"
-        elif job.combined_score >= 0.5:
-            score_emoji = "✨"
-        else:
-            score_emoji = "📌"
+        score = job.combined_score
+        score_emoji = "🔥" if score >= 0.7 else "✨" if score >= 0.5 else "📌"
         
         # Category tag
-        category_tags = {
-            "Data Science": "🧪 DS",
-            "Data Analytics": "📊 DA",
-            "ML Engineering": "🤖 ML",
-            "BI Developer": "📈 BI",
-            "Data Engineering": "⚙️ DE",
-        }
-        category = category_tags.get(job.category.value, "💼")
+        category = _CATEGORY_TAGS.get(job.category.value, "💼")
         
         # Location
         location = job.city or job.location or "India"
@@ -78,26 +104,26 @@ class TelegramNotifier:
         # Build message
         score_pct = int(job.combined_score * 100)
         
-        message = (
+        parts = [
             f"{score_emoji} <b>{category} - {score_pct}% Match</b>\n\n"
             f"💼 <b>{job.title}</b>\n"
             f"🏢 {job.company}\n"
             f"📍 {location}\n"
             f"🌐 {job.source}\n"
-        )
+        ]
         
         if job.posted:
-            message += f"⏰ {job.posted}\n"
+            parts.append(f"⏰ {job.posted}\n")
         
         if job.salary:
-            message += f"💰 {job.salary}\n"
+            parts.append(f"💰 {job.salary}\n")
         
         if job.llm_experience_required:
-            message += f"📋 Exp: {job.llm_experience_required}\n"
+            parts.append(f"📋 Exp: {job.llm_experience_required}\n")
         
-        message += f"\n<a href=\"{job.url}\">🔗 Apply Now</a>"
+        parts.append(f"\n<a href=\"{job.url}\">🔗 Apply Now</a>")
         
-        return message
+        return "".join(parts)
     
     async def send_job(self, job: ProcessedJob) -> bool:
         """Send single job notification"""
@@ -105,40 +131,42 @@ class TelegramNotifier:
             return False
         
         message = self._format_job_message(job)
+        body = self._job_form + b"&text=" + urllib.parse.quote_plus(message).encode()
         
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                response = await client.post(
-                    f"{self.base_url}/sendMessage",
-                    data={
-                        "chat_id": self.chat_id,
-                        "text": message,
-                        "parse_mode": "HTML",
-                        "disable_web_page_preview": "false"
-                    }
-                )
-                
-                success = response.status_code == 200
-                if not success:
-                    logger.warning(f"Telegram send failed: {response.status_code}")
-                return success
+            client = await self._get_client()
+            response = await client.post(
+                f"{self.base_url}/sendMessage",
+                content=body,
+                headers=_FORM_HEADERS
+            )
+            
+            success = response.status_code == 200
+            if not success:
+                logger.warning(f"Telegram send failed: {response.status_code}")
+            return success
         except Exception as e:
             logger.error(f"Telegram send error: {e}")
             return False
     
-    async def send_jobs_batch(self, jobs: List[ProcessedJob], delay: float = 1.0) -> int:
-        """Send multiple job notifications with rate limiting"""
+    async def send_jobs_batch(self, jobs: List[ProcessedJob],
+                              delay: float = 1.0) -> List[ProcessedJob]:
+        """
+        Send multiple job notifications with rate limiting.
+        Sends one at a time, in order, `delay` seconds apart (Telegram allows ~1 msg/s per chat).
+        Returns the jobs that were actually delivered.
+        """
         if not self.is_configured:
-            return 0
+            return []
         
-        sent_count = 0
+        sent_jobs = []
         for job in jobs:
             if await self.send_job(job):
-                sent_count += 1
+                sent_jobs.append(job)
                 logger.debug(f"Sent: {job.title[:40]}...")
             await asyncio.sleep(delay)
         
-        return sent_count
+        return sent_jobs
     
     async def send_summary(self, total_fetched: int, total_new: int, 
                           total_matched: int, total_notified: int, 
@@ -158,16 +186,16 @@ class TelegramNotifier:
         )
         
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                response = await client.post(
-                    f"{self.base_url}/sendMessage",
-                    data={
-                        "chat_id": self.chat_id,
-                        "text": message,
-                        "parse_mode": "HTML"
-                    }
-                )
-                return response.status_code == 200
+            client = await self._get_client()
+            response = await client.post(
+                f"{self.base_url}/sendMessage",
+                data={
+                    "chat_id": self.chat_id,
+                    "text": message,
+                    "parse_mode": "HTML"
+                }
+            )
+            return response.status_code == 200
         except Exception as e:
             logger.error(f"Telegram summary error: {e}")
             return False
@@ -201,22 +229,14 @@ class ConsoleNotifier:
             self.print_job(job)
 
 
-# Global instances
-_telegram = None
-_console = None
-
-
+# Global instances (created on first call)
+@cache
 def get_telegram_notifier() -> TelegramNotifier:
     """Get Telegram notifier instance"""
-    global _telegram
-    if _telegram is None:
-        _telegram = TelegramNotifier()
-    return _telegram
+    return TelegramNotifier()
 
 
+@cache
 def get_console_notifier() -> ConsoleNotifier:
     """Get console notifier instance"""
-    global _console
-    if _console is None:
-        _console = ConsoleNotifier()
-    return _console
+    return ConsoleNotifier()
@@ -0,0 +1,28 @@
+"""
+Tests for shared source helpers.
+"""
+
+from src.sources.base import BaseJobSource, canonical_url
+
+
+def test_canonical_url_keeps_job_id_query_and_path_case():
+    assert canonical_url("https://in.indeed.com/viewjob?jk=aaa111") != canonical_url(
+        "https://in.indeed.com/viewjob?jk=bbb222"
+    )
+    assert canonical_url("https://Jobs.Example.com/Careers/ABC/") == "https://jobs.example.com/Careers/ABC"
+
+
+def test_canonical_url_drops_tracking_params():
+    assert canonical_url("https://acme.com/careers?gh_jid=1&utm_source=google_jobs_apply&gh_src=x") == (
+        "https://acme.com/careers?gh_jid=1"
+    )
+
+
+def test_claim_url_dedups_listings_but_not_bare_sites():
+    seen = set()
+    assert BaseJobSource._claim_url("https://acme.com/careers?gh_jid=1", seen)
+    assert BaseJobSource._claim_url("https://acme.com/careers?gh_jid=2", seen)
+    assert not BaseJobSource._claim_url("https://acme.com/careers/?utm_medium=x&gh_jid=2", seen)
+
+    assert BaseJobSource._claim_url("https://www.naukri.com", seen)
+    assert BaseJobSource._claim_url("https://www.naukri.com", seen)
@@ -0,0 +1,84 @@
+"""
+Tests for India-focused job sources.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.sources import india
+from src.sources.india import WorkingNomadsSource, _AsyncByteReader
+
+
+def _feed(count: int) -> bytes:
+    return json.dumps([
+        {
+            "title": f"Data Analyst {i}",
+            "company_name": f"Company {i}",
+            "category_name": "Data",
+            "location": "Remote",
+            "url": f"https://www.workingnomads.com/jobs/{i}",
+        }
+        for i in range(count)
+    ]).encode()
+
+
+async def _chunked(body: bytes, size: int):
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+def test_byte_reader_probe_does_not_consume_data():
+    async def read_all():
+        reader = _AsyncByteReader(_chunked(b"0123456789", 4))
+        assert await reader.read(0) == b""
+        parts = [await reader.read(3)]
+        while True:
+            part = await reader.read(3)
+            if not part:
+                return b"".join(parts)
+            parts.append(part)
+
+    assert asyncio.run(read_all()) == b"0123456789"
+
+
+def test_working_nomads_streams_multi_chunk_feed(monkeypatch):
+    if india.ijson is None:
+        pytest.skip("ijson not installed")
+
+    body = _feed(500)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=_chunked(body, 4096))
+
+    async def fetch():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            monkeypatch.setattr(india, "get_shared_client", lambda: client)
+            return await WorkingNomadsSource().fetch_jobs(["data analyst"])
+
+    batch = asyncio.run(fetch())
+    assert batch.error is None
+    assert len(batch.jobs) == 500
+
+
+_ADZUNA_PAGE = json.dumps({"results": [
+    {"title": "Data Analyst", "company": {"display_name": "Acme"}, "location": None, "salary_min": 50000},
+    {"title": "Data Scientist", "salary_min": 1.5},
+]}).encode()
+
+
+def test_adzuna_rows_match_with_and_without_msgspec(monkeypatch):
+    rows = india._parse_adzuna_page(_ADZUNA_PAGE)
+    monkeypatch.setattr(india, "msgspec", None)
+    assert india._parse_adzuna_page(_ADZUNA_PAGE) == rows
+    assert [row.salary for row in rows] == ["50000", "1.5"]
+    assert rows[0].company == "Acme" and rows[0].location == "India"
+
+
+def test_adzuna_page_with_unexpected_field_type_keeps_results():
+    page = json.dumps({"results": [{"title": "Data Analyst", "company": "Acme", "salary_min": "n/a"}]}).encode()
+    rows = india._parse_adzuna_page(page)
+    assert [row.title for row in rows] == ["Data Analyst"]
+    assert rows[0].company == "Unknown"
@@ -0,0 +1,30 @@
+"""
+Tests for data models.
+"""
+
+from src.database.models import RawJob
+
+
+def _job(**overrides) -> RawJob:
+    fields = {"title": "Data Analyst", "company": "Acme", "url": "https://acme.com/jobs/1", "source": "Test"}
+    fields.update(overrides)
+    return RawJob(**fields)
+
+
+def test_job_id_is_stable_and_follows_identity_fields():
+    job = _job()
+    assert job.job_id == _job().job_id
+    assert job.job_id != _job(title="Data Scientist").job_id
+
+
+def test_job_id_not_stale_after_copy_or_assignment():
+    job = _job()
+    original = job.job_id
+
+    copied = job.model_copy(update={"title": "Data Scientist"})
+    assert copied.job_id == _job(title="Data Scientist").job_id
+
+    job.company = "Other"
+    assert job.job_id == _job(company="Other").job_id
+    assert job.job_id != original
+    assert "job_id" in job.model_dump()